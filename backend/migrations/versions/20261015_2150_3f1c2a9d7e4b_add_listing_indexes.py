@@ -0,0 +1,55 @@
+"""Add chat and document listing indexes
+
+Revision ID: 3f1c2a9d7e4b
+Revises: 55bef21b3598
+Create Date: 2026-10-15 21:50:12.418305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d7e4b'
+down_revision = '55bef21b3598'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chats_user_updated_at',
+            'chats',
+            ['user_id', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_documents_user_updated_at',
+            'documents',
+            ['user_id', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_documents_user_kind_updated_at',
+            'documents',
+            ['user_id', 'kind', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_documents_user_kind_updated_at',
+            table_name='documents',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_documents_user_updated_at', table_name='documents', postgresql_concurrently=True
+        )
+        op.drop_index('ix_chats_user_updated_at', table_name='chats', postgresql_concurrently=True)
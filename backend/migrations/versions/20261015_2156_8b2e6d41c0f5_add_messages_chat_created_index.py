@@ -0,0 +1,46 @@
+"""Add messages (chat_id, created_at) index
+
+Revision ID: 8b2e6d41c0f5
+Revises: 3f1c2a9d7e4b
+Create Date: 2026-10-15 21:56:40.291774
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e6d41c0f5'
+down_revision = '3f1c2a9d7e4b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_messages_chat_created',
+            'messages',
+            ['chat_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Superseded by the composite index's leading column
+        op.drop_index(
+            'ix_messages_chat_id', table_name='messages', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_messages_chat_id',
+            'messages',
+            ['chat_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_messages_chat_created', table_name='messages', postgresql_concurrently=True
+        )
@@ -0,0 +1,85 @@
+"""Replace listing indexes with keyset pagination indexes
+
+Revision ID: c7a94e2f1b36
+Revises: 8b2e6d41c0f5
+Create Date: 2026-10-15 22:30:41.207514
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a94e2f1b36'
+down_revision = '8b2e6d41c0f5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chats_user_updated_id',
+            'chats',
+            ['user_id', sa.text('updated_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_documents_user_updated_id',
+            'documents',
+            ['user_id', sa.text('updated_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_documents_user_kind_updated_id',
+            'documents',
+            ['user_id', 'kind', sa.text('updated_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_chats_user_updated_at', table_name='chats', postgresql_concurrently=True)
+        op.drop_index(
+            'ix_documents_user_updated_at', table_name='documents', postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_documents_user_kind_updated_at',
+            table_name='documents',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_documents_user_kind_updated_at',
+            'documents',
+            ['user_id', 'kind', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_documents_user_updated_at',
+            'documents',
+            ['user_id', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_chats_user_updated_at',
+            'chats',
+            ['user_id', sa.text('updated_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_documents_user_kind_updated_id',
+            table_name='documents',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_documents_user_updated_id', table_name='documents', postgresql_concurrently=True
+        )
+        op.drop_index('ix_chats_user_updated_id', table_name='chats', postgresql_concurrently=True)
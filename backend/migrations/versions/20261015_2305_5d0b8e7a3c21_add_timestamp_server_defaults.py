@@ -0,0 +1,37 @@
+"""Default timestamps to the database's UTC clock
+
+Revision ID: 5d0b8e7a3c21
+Revises: c7a94e2f1b36
+Create Date: 2026-10-15 23:05:17.684920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d0b8e7a3c21'
+down_revision = 'c7a94e2f1b36'
+branch_labels = None
+depends_on = None
+
+UTC_NOW = sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+
+TIMESTAMP_COLUMNS = [
+    ('chats', 'created_at'),
+    ('chats', 'updated_at'),
+    ('documents', 'created_at'),
+    ('documents', 'updated_at'),
+    ('messages', 'created_at'),
+    ('suggestions', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.DateTime(), server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.DateTime(), server_default=None)
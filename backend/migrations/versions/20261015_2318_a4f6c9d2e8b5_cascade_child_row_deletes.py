@@ -0,0 +1,40 @@
+"""Cascade message and suggestion deletes in the database
+
+Revision ID: a4f6c9d2e8b5
+Revises: 5d0b8e7a3c21
+Create Date: 2026-10-15 23:18:02.551873
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4f6c9d2e8b5'
+down_revision = '5d0b8e7a3c21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('messages_chat_id_fkey', 'messages', type_='foreignkey')
+    op.create_foreign_key(
+        'messages_chat_id_fkey', 'messages', 'chats', ['chat_id'], ['id'], ondelete='CASCADE'
+    )
+    op.drop_constraint('suggestions_document_id_fkey', 'suggestions', type_='foreignkey')
+    op.create_foreign_key(
+        'suggestions_document_id_fkey',
+        'suggestions',
+        'documents',
+        ['document_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('suggestions_document_id_fkey', 'suggestions', type_='foreignkey')
+    op.create_foreign_key(
+        'suggestions_document_id_fkey', 'suggestions', 'documents', ['document_id'], ['id']
+    )
+    op.drop_constraint('messages_chat_id_fkey', 'messages', type_='foreignkey')
+    op.create_foreign_key('messages_chat_id_fkey', 'messages', 'chats', ['chat_id'], ['id'])
@@ -0,0 +1,48 @@
+"""Add suggestions listing index
+
+Revision ID: e2d7b4a91f60
+Revises: a4f6c9d2e8b5
+Create Date: 2026-10-15 23:31:46.093152
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2d7b4a91f60'
+down_revision = 'a4f6c9d2e8b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_suggestions_document_resolved_created',
+            'suggestions',
+            ['document_id', 'is_resolved', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # The document_id prefix of the new index covers lookups by document alone
+        op.drop_index(
+            'ix_suggestions_document_id', table_name='suggestions', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_suggestions_document_id',
+            'suggestions',
+            ['document_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_suggestions_document_resolved_created',
+            table_name='suggestions',
+            postgresql_concurrently=True,
+        )
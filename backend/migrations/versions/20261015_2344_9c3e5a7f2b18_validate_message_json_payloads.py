@@ -0,0 +1,35 @@
+"""Validate message JSON payloads
+
+Revision ID: 9c3e5a7f2b18
+Revises: e2d7b4a91f60
+Create Date: 2026-10-15 23:44:12.518307
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9c3e5a7f2b18'
+down_revision = 'e2d7b4a91f60'
+branch_labels = None
+depends_on = None
+
+
+CHECKS = {
+    'ck_messages_parts_array': "jsonb_typeof(parts) = 'array'",
+    'ck_messages_attachments_array': "jsonb_typeof(attachments) = 'array'",
+}
+
+
+def upgrade() -> None:
+    # Add the checks without scanning the table under an exclusive lock, then
+    # validate existing rows under a lock that still allows reads and writes
+    for name, condition in CHECKS.items():
+        op.execute(f'ALTER TABLE messages ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID')
+    for name in CHECKS:
+        op.execute(f'ALTER TABLE messages VALIDATE CONSTRAINT {name}')
+
+
+def downgrade() -> None:
+    for name in CHECKS:
+        op.drop_constraint(name, 'messages', type_='check')
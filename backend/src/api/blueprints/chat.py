@@ -1,13 +1,14 @@
 """Chat blueprint for handling chat endpoints."""
 import asyncio
+import queue
+import threading
 from uuid import UUID, uuid4
 
-from flask import Blueprint, Response, jsonify, request, stream_with_context
-from sqlalchemy.orm import Session
+from flask import Blueprint, Response, request, stream_with_context
 
-from src.config.database import SessionLocal
+from src.config.database import SessionLocal, db_session
 from src.services.chat_service import ChatService
-from src.services.llm_service import LLMService
+from src.services.llm_service import get_llm_service
 from src.services.streaming_service import SSEService
 from src.services.tools.document_tools import (
     create_document_tool,
@@ -17,91 +18,222 @@ from src.services.tools.document_tools import (
 from src.services.tools.weather_tool import get_weather
 from src.utils.auth import get_user_id_from_request, require_auth
 from src.utils.errors import BadRequestError, ForbiddenError, NotFoundError
+from src.utils.event_loop import submit
+from src.utils.responses import json_list_response, orjson_response
+from src.utils.validation import parse_uuid
 
 chat_bp = Blueprint("chat", __name__, url_prefix="/api/chat")
 
+# Sentinel marking the end of a pumped stream
+_STREAM_DONE = object()
+
+# Title of a new chat until its generated title is available
+DEFAULT_CHAT_TITLE = "New chat"
+
+# Upper bound on SSE chunks buffered for a slow client
+STREAM_QUEUE_SIZE = 64
+
+# Seconds between retries while the queue is full
+STREAM_PUT_INTERVAL = 0.05
+
+
+def _save_reply(chat_id: UUID, text: str):
+    """
+    Save an assistant reply with a short-lived session.
+
+    Args:
+        chat_id: Chat ID
+        text: Reply text
+    """
+    with SessionLocal() as db:
+        ChatService.add_message(
+            db,
+            chat_id,
+            role="assistant",
+            parts=[{"type": "text", "text": text}],
+            attachments=[],
+        )
+
+
+def _save_title(chat_id: UUID, title: str) -> bool:
+    """
+    Save a generated chat title with a short-lived session.
+
+    Args:
+        chat_id: Chat ID
+        title: New title
+
+    Returns:
+        True if the chat was updated
+    """
+    with SessionLocal() as db:
+        return ChatService.update_chat_title(db, chat_id, title)
+
 
 async def stream_chat_response(
-    db: Session,
     user_id: UUID,
     chat_id: UUID,
     messages: list,
     model_id: str,
     system_prompt: str = None,
+    title_source: str = None,
 ):
     """
     Stream chat response using LLM.
 
+    No database connection is held while tokens stream; the reply is saved
+    with a short-lived session once generation finishes.
+
     Args:
-        db: Database session
         user_id: User ID
         chat_id: Chat ID
         messages: Message history
         model_id: Model to use
         system_prompt: Optional system prompt
+        title_source: First user message of a new chat; when given, a title is
+            generated alongside the reply and sent as a title-update event
 
     Yields:
         SSE-formatted response chunks
     """
-    llm_service = LLMService(model_id)
+    llm_service = get_llm_service(model_id)
     assistant_message_id = str(uuid4())
-    full_response = ""
+    response_parts = []
+    title_task = None
 
     try:
+        # Generate the title of a new chat concurrently with the reply
+        if title_source is not None:
+            title_task = asyncio.get_running_loop().run_in_executor(
+                None, llm_service.generate_title, title_source
+            )
+
         # Send message start event
-        yield SSEService.format_sse(
-            {"type": "message-start", "id": assistant_message_id, "chat_id": str(chat_id)},
-            event="message",
-        )
+        yield SSEService.message_start(assistant_message_id, str(chat_id))
 
-        # Stream tokens
-        async for token in llm_service.stream_chat(
-            messages=messages, system_prompt=system_prompt
-        ):
-            full_response += token
-            yield SSEService.format_sse({"type": "text-delta", "content": token}, event="message")
+        # Stream tokens, coalescing them into batches to cut per-frame writes
+        tokens = llm_service.stream_chat(messages=messages, system_prompt=system_prompt)
+        async for text in SSEService.coalesce_tokens(tokens):
+            response_parts.append(text)
+            yield SSEService.text_delta(text)
 
-        # Save assistant message
-        ChatService.add_message(
-            db,
-            chat_id,
-            role="assistant",
-            parts=[{"type": "text", "text": full_response}],
-            attachments=[],
-        )
+        # Save assistant message; database calls block, so they run off the event loop
+        await asyncio.to_thread(_save_reply, chat_id, "".join(response_parts))
+
+        if title_task is not None:
+            try:
+                title = await title_task
+            except Exception:
+                # Keep the placeholder title; the reply itself succeeded
+                title = None
+            if title:
+                title_updated = await asyncio.to_thread(_save_title, chat_id, title)
+                if title_updated:
+                    yield SSEService.format_sse(
+                        {"type": "title-update", "chat_id": str(chat_id), "title": title},
+                        event="message",
+                    )
 
         # Send message finish event
-        yield SSEService.format_sse(
-            {"type": "message-finish", "id": assistant_message_id}, event="message"
-        )
+        yield SSEService.message_finish(assistant_message_id)
 
     except Exception as e:
         yield SSEService.stream_error(str(e))
+
     finally:
-        db.close()
+        # A reply that failed or was abandoned never awaits the title: cancel it if it
+        # has not started, or retrieve its error so it is not reported as unhandled
+        if title_task is not None and not title_task.cancel() and not title_task.cancelled():
+            title_task.exception()
+
+
+async def _put_chunk(chunks: queue.Queue, chunk, cancelled: threading.Event) -> bool:
+    """
+    Put a chunk on a bounded queue, waiting while the client is behind.
+
+    Waiting yields to the event loop, so a slow client only pauses its own stream.
+
+    Args:
+        chunks: Queue the chunks are handed over through
+        chunk: Chunk to hand over
+        cancelled: Set once the client has gone away
+
+    Returns:
+        True if the chunk was queued, False if the stream was cancelled
+    """
+    while not cancelled.is_set():
+        try:
+            chunks.put_nowait(chunk)
+            return True
+        except queue.Full:
+            await asyncio.sleep(STREAM_PUT_INTERVAL)
+    return False
+
+
+async def _pump_stream(async_gen, chunks: queue.Queue, cancelled: threading.Event):
+    """
+    Drain an async generator into a bounded thread-safe queue.
+
+    A full queue pauses the producer, which in turn stops reading from the LLM
+    stream; a cancelled stream stops the generator altogether.
+
+    Args:
+        async_gen: Async generator producing SSE chunks
+        chunks: Queue the chunks are handed over through
+        cancelled: Set once the client has gone away
+    """
+    try:
+        async for chunk in async_gen:
+            if not await _put_chunk(chunks, chunk, cancelled):
+                break
+    finally:
+        await async_gen.aclose()
+        # Wait for room rather than drop the end marker, or a consumer that is
+        # behind would only notice the end after a ping interval
+        await _put_chunk(chunks, _STREAM_DONE, cancelled)
 
 
 def stream_chat_response_sync(
-    db: Session,
     user_id: UUID,
     chat_id: UUID,
     messages: list,
     model_id: str,
     system_prompt: str = None,
+    title_source: str = None,
 ):
-    """Synchronous wrapper for async streaming function."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    """
+    Synchronous wrapper for async streaming function.
+
+    The async generator runs on the process-wide background event loop, shared
+    by every stream, instead of on a thread and loop of its own; chunks are
+    handed back to the WSGI response through a bounded queue. When the client
+    disconnects, the WSGI server closes this generator and the producer task is
+    cancelled so the LLM stream is abandoned.
+    """
+    chunks = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+    cancelled = threading.Event()
+
+    async_gen = stream_chat_response(
+        user_id, chat_id, messages, model_id, system_prompt, title_source
+    )
+    producer = submit(_pump_stream(async_gen, chunks, cancelled))
+
     try:
-        async_gen = stream_chat_response(db, user_id, chat_id, messages, model_id, system_prompt)
         while True:
             try:
-                chunk = loop.run_until_complete(async_gen.__anext__())
-                yield chunk
-            except StopAsyncIteration:
+                chunk = chunks.get(timeout=SSEService.PING_INTERVAL)
+            except queue.Empty:
+                if producer.done():
+                    break
+                yield SSEService.ping()
+                continue
+            if chunk is _STREAM_DONE:
                 break
+            yield chunk
     finally:
-        loop.close()
+        cancelled.set()
+        producer.cancel()
+
 
 @chat_bp.route("", methods=["POST"])
 @require_auth
@@ -109,11 +241,11 @@ def create_or_continue_chat():
     """Create or continue a chat conversation with streaming response."""
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
+        return orjson_response({"error": "Unauthorized"}, 401)
 
     data = request.json
     if not data:
-        return jsonify({"error": "Invalid request body"}), 400
+        return orjson_response({"error": "Invalid request body"}, 400)
 
     chat_id = data.get("chat_id")
     message = data.get("message")
@@ -121,71 +253,74 @@ def create_or_continue_chat():
     system_prompt = data.get("system_prompt")
 
     if not message or not message.get("parts"):
-        return jsonify({"error": "Message is required"}), 400
+        return orjson_response({"error": "Message is required"}, 400)
 
     db = SessionLocal()
 
     try:
-        # Get or create chat
+        # Get chat together with its history
         chat = None
-        if chat_id:
-            try:
-                chat_uuid = UUID(chat_id)
-                chat = ChatService.get_chat(db, chat_uuid, user_id)
-            except ValueError:
-                # Invalid UUID format, create new chat
-                chat = None
-        
-        # If no chat_id provided or chat not found, create new chat
-        if not chat:
-            llm_service = LLMService(model_id)
-            user_text = ""
-            for part in message.get("parts", []):
-                if part.get("type") == "text":
-                    user_text += part.get("text", "")
+        chat_uuid = parse_uuid(chat_id)
+        if chat_uuid:
+            chat = ChatService.get_chat(db, chat_uuid, user_id, with_messages=True)
 
-            title = llm_service.generate_title(user_text)
+        # Earlier turns were loaded with the chat; a new chat has none
+        history = list(chat.messages) if chat else []
+
+        # If no chat_id provided or chat not found, create new chat. Its real title
+        # is generated while the reply streams, so it starts with a placeholder.
+        title_source = None
+        if not chat:
+            title_source = "".join(
+                part.get("text", "")
+                for part in message.get("parts", [])
+                if part.get("type") == "text"
+            )
             chat = ChatService.create_chat(
-                db, user_id, title, visibility=data.get("visibility", "private")
+                db,
+                user_id,
+                DEFAULT_CHAT_TITLE,
+                visibility=data.get("visibility", "private"),
+                commit=False,
             )
-            chat_uuid = chat.id
-        else:
-            chat_uuid = chat.id
+
+        chat_uuid = chat.id
 
         # Save user message
-        ChatService.add_message(
+        user_message = ChatService.add_message(
             db,
             chat_uuid,
             role=message.get("role", "user"),
             parts=message.get("parts"),
             attachments=message.get("attachments", []),
+            commit=False,
         )
 
-        # Get message history
-        messages = ChatService.get_messages(db, chat_uuid)
+        # Build message history in memory instead of re-selecting it
         message_history = [
             {"role": msg.role, "parts": msg.parts, "attachments": msg.attachments}
-            for msg in messages
+            for msg in [*history, user_message]
         ]
 
-        # Stream response
-        return Response(
-            stream_with_context(
-                stream_chat_response_sync(
-                    db, user_id, chat_uuid, message_history, model_id, system_prompt
-                )
-            ),
-            mimetype="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "X-Accel-Buffering": "no",
-                "Connection": "keep-alive",
-            },
-        )
+        # Persist the new chat (if any) and the user message in one commit
+        db.commit()
 
     except Exception as e:
+        return orjson_response({"error": str(e)}, 500)
+    finally:
+        # Return the connection to the pool before the long-running stream starts
         db.close()
-        return jsonify({"error": str(e)}), 500
+
+    # Stream response
+    return Response(
+        stream_with_context(
+            stream_chat_response_sync(
+                user_id, chat_uuid, message_history, model_id, system_prompt, title_source
+            )
+        ),
+        mimetype="text/event-stream",
+        headers=SSEService.RESPONSE_HEADERS,
+    )
 
 
 @chat_bp.route("", methods=["DELETE"])
@@ -199,27 +334,21 @@ def delete_chat():
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
+        return orjson_response({"error": "Unauthorized"}, 401)
 
     chat_id = request.args.get("id")
     if not chat_id:
-        return jsonify({"error": "Chat ID is required"}), 400
+        return orjson_response({"error": "Chat ID is required"}, 400)
 
-    db = SessionLocal()
+    chat_uuid = parse_uuid(chat_id)
+    if chat_uuid is None:
+        return orjson_response({"error": "Invalid chat ID format"}, 400)
 
-    try:
-        chat_uuid = UUID(chat_id)
-        deleted = ChatService.delete_chat(db, chat_uuid, user_id)
-
-        if deleted:
-            return jsonify({"success": True, "id": chat_id}), 200
-        else:
-            return jsonify({"error": "Chat not found"}), 404
-
-    except ValueError:
-        return jsonify({"error": "Invalid chat ID format"}), 400
-    finally:
-        db.close()
+    deleted = ChatService.delete_chat(db_session, chat_uuid, user_id)
+    if deleted:
+        return orjson_response({"success": True, "id": chat_id}, 200)
+    else:
+        return orjson_response({"error": "Chat not found"}, 404)
 
 
 @chat_bp.route("/<chat_id>/messages", methods=["GET"])
@@ -233,22 +362,15 @@ def get_chat_messages(chat_id: str):
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
-
-    db = SessionLocal()
+        return orjson_response({"error": "Unauthorized"}, 401)
 
-    try:
-        chat_uuid = UUID(chat_id)
-        # Verify ownership
-        chat = ChatService.get_chat(db, chat_uuid, user_id)
-        if not chat:
-            return jsonify({"error": "Chat not found"}), 404
+    chat_uuid = parse_uuid(chat_id)
+    if chat_uuid is None:
+        return orjson_response({"error": "Invalid chat ID format"}, 400)
 
-        messages = ChatService.get_messages(db, chat_uuid)
-        return jsonify({"messages": [msg.to_dict() for msg in messages]}), 200
+    messages = ChatService.get_messages_for_user(db_session, chat_uuid, user_id)
+    if messages is None:
+        return orjson_response({"error": "Chat not found"}, 404)
 
-    except ValueError:
-        return jsonify({"error": "Invalid chat ID format"}), 400
-    finally:
-        db.close()
+    return json_list_response(messages, "messages")
 
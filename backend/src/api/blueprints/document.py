@@ -1,14 +1,18 @@
 """Document blueprint for artifact handling."""
-from uuid import UUID
+from flask import Blueprint, request
 
-from flask import Blueprint, jsonify, request
-
-from src.config.database import SessionLocal
+from src.config.database import db_session
+from src.models.document import DOCUMENT_KINDS, VALID_DOCUMENT_KINDS
 from src.services.document_service import DocumentService
 from src.utils.auth import get_user_id_from_request, require_auth
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.utils.responses import YIELD_PER, json_list_response, orjson_response
+from src.utils.validation import parse_uuid
 
 document_bp = Blueprint("document", __name__, url_prefix="/api/document")
 
+_INVALID_KIND_ERROR = {"error": f"Invalid kind. Must be one of: {', '.join(DOCUMENT_KINDS)}"}
+
 
 @document_bp.route("", methods=["POST"])
 @require_auth
@@ -25,27 +29,21 @@ def create_document():
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
+        return orjson_response({"error": "Unauthorized"}, 401)
 
     data = request.json
     if not data or not data.get("title"):
-        return jsonify({"error": "Title is required"}), 400
+        return orjson_response({"error": "Title is required"}, 400)
 
     title = data.get("title")
     content = data.get("content", "")
     kind = data.get("kind", "text")
 
-    valid_kinds = ["text", "code", "image", "sheet"]
-    if kind not in valid_kinds:
-        return jsonify({"error": f"Invalid kind. Must be one of: {', '.join(valid_kinds)}"}), 400
-
-    db = SessionLocal()
+    if kind not in VALID_DOCUMENT_KINDS:
+        return orjson_response(_INVALID_KIND_ERROR, 400)
 
-    try:
-        document = DocumentService.create_document(db, user_id, title, content, kind)
-        return jsonify(document.to_dict()), 201
-    finally:
-        db.close()
+    document = DocumentService.create_document(db_session, user_id, title, content, kind)
+    return orjson_response(document.to_dict(), 201)
 
 
 @document_bp.route("/<document_id>", methods=["GET"])
@@ -59,23 +57,17 @@ def get_document(document_id: str):
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
+        return orjson_response({"error": "Unauthorized"}, 401)
 
-    db = SessionLocal()
+    doc_uuid = parse_uuid(document_id)
+    if doc_uuid is None:
+        return orjson_response({"error": "Invalid document ID format"}, 400)
 
-    try:
-        doc_uuid = UUID(document_id)
-        document = DocumentService.get_document(db, doc_uuid, user_id)
+    document = DocumentService.get_document(db_session, doc_uuid, user_id)
+    if not document:
+        return orjson_response({"error": "Document not found"}, 404)
 
-        if not document:
-            return jsonify({"error": "Document not found"}), 404
-
-        return jsonify(document.to_dict()), 200
-
-    except ValueError:
-        return jsonify({"error": "Invalid document ID format"}), 400
-    finally:
-        db.close()
+    return orjson_response(document.to_dict(), 200)
 
 
 @document_bp.route("/<document_id>", methods=["PUT"])
@@ -94,27 +86,21 @@ def update_document(document_id: str):
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
+        return orjson_response({"error": "Unauthorized"}, 401)
+
+    doc_uuid = parse_uuid(document_id)
+    if doc_uuid is None:
+        return orjson_response({"error": "Invalid document ID format"}, 400)
 
     data = request.json
     if not data or "content" not in data:
-        return jsonify({"error": "Content is required"}), 400
+        return orjson_response({"error": "Content is required"}, 400)
 
-    db = SessionLocal()
+    document = DocumentService.update_document(db_session, doc_uuid, user_id, data["content"])
+    if not document:
+        return orjson_response({"error": "Document not found"}, 404)
 
-    try:
-        doc_uuid = UUID(document_id)
-        document = DocumentService.update_document(db, doc_uuid, user_id, data["content"])
-
-        if not document:
-            return jsonify({"error": "Document not found"}), 404
-
-        return jsonify(document.to_dict()), 200
-
-    except ValueError:
-        return jsonify({"error": "Invalid document ID format"}), 400
-    finally:
-        db.close()
+    return orjson_response(document.to_dict(), 200)
 
 
 @document_bp.route("/<document_id>", methods=["DELETE"])
@@ -128,23 +114,17 @@ def delete_document(document_id: str):
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
-
-    db = SessionLocal()
-
-    try:
-        doc_uuid = UUID(document_id)
-        deleted = DocumentService.delete_document(db, doc_uuid, user_id)
+        return orjson_response({"error": "Unauthorized"}, 401)
 
-        if deleted:
-            return jsonify({"success": True, "id": document_id}), 200
-        else:
-            return jsonify({"error": "Document not found"}), 404
+    doc_uuid = parse_uuid(document_id)
+    if doc_uuid is None:
+        return orjson_response({"error": "Invalid document ID format"}, 400)
 
-    except ValueError:
-        return jsonify({"error": "Invalid document ID format"}), 400
-    finally:
-        db.close()
+    deleted = DocumentService.delete_document(db_session, doc_uuid, user_id)
+    if deleted:
+        return orjson_response({"success": True, "id": document_id}, 200)
+    else:
+        return orjson_response({"error": "Document not found"}, 404)
 
 
 @document_bp.route("", methods=["GET"])
@@ -156,19 +136,23 @@ def list_documents():
     Query params:
         kind: Optional filter by document kind
         limit: Maximum number of documents (default 50)
+        cursor: Optional next_cursor of the previous page
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
+        return orjson_response({"error": "Unauthorized"}, 401)
 
     kind = request.args.get("kind")
     limit = int(request.args.get("limit", 50))
 
-    db = SessionLocal()
+    cursor = None
+    if "cursor" in request.args:
+        cursor = decode_cursor(request.args["cursor"])
+        if cursor is None:
+            return orjson_response({"error": "Invalid cursor"}, 400)
 
-    try:
-        documents = DocumentService.get_user_documents(db, user_id, kind, limit)
-        return jsonify({"documents": [doc.to_dict() for doc in documents]}), 200
-    finally:
-        db.close()
+    documents = DocumentService.get_user_documents(
+        db_session, user_id, kind, limit, yield_per=YIELD_PER, cursor=cursor
+    )
+    return json_list_response(documents, "documents", cursor_of=encode_cursor, limit=limit)
 
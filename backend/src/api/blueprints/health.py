@@ -1,29 +1,30 @@
 """Health check blueprint."""
-from flask import Blueprint, jsonify
+import orjson
+from flask import Blueprint, Response
 
 from src.config.settings import settings
+from src.services.llm_service import LLMService
 
 health_bp = Blueprint("health", __name__, url_prefix="/api/health")
 
+# The health payload never changes while the process runs, so serialize it once
+_HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": "aether-ai-backend",
+        "version": "0.1.0",
+        "ollama_host": settings.OLLAMA_HOST,
+    }
+)
+
 
 @health_bp.route("", methods=["GET"])
 def health_check():
     """Health check endpoint."""
-    return jsonify(
-        {
-            "status": "healthy",
-            "service": "aether-ai-backend",
-            "version": "0.1.0",
-            "ollama_host": settings.OLLAMA_HOST,
-        }
-    )
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 
 @health_bp.route("/models", methods=["GET"])
 def list_models():
     """List available models."""
-    from src.services.llm_service import LLMService
-
-    models = LLMService.list_available_models()
-    return jsonify({"models": models})
-
+    return Response(LLMService.list_available_models_json(), mimetype="application/json")
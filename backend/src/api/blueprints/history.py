@@ -1,9 +1,11 @@
 """History blueprint for chat history endpoints."""
-from flask import Blueprint, jsonify
+from flask import Blueprint, request
 
-from src.config.database import SessionLocal
+from src.config.database import db_session
 from src.services.chat_service import ChatService
 from src.utils.auth import get_user_id_from_request, require_auth
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.utils.responses import json_list_response, orjson_response
 
 history_bp = Blueprint("history", __name__, url_prefix="/api/history")
 
@@ -15,16 +17,21 @@ def get_user_history():
     Get user's chat history.
 
     Returns list of user's chats ordered by most recent.
+
+    Query params:
+        cursor: Optional next_cursor of the previous page
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
+        return orjson_response({"error": "Unauthorized"}, 401)
 
-    db = SessionLocal()
+    cursor = None
+    if "cursor" in request.args:
+        cursor = decode_cursor(request.args["cursor"])
+        if cursor is None:
+            return orjson_response({"error": "Invalid cursor"}, 400)
 
-    try:
-        chats = ChatService.get_user_chats(db, user_id, limit=50)
-        return jsonify({"chats": [chat.to_dict() for chat in chats]}), 200
-    finally:
-        db.close()
+    limit = 50
+    chats = ChatService.list_chats_lite(db_session, user_id, limit=limit, cursor=cursor)
+    return json_list_response(chats, "chats", cursor_of=encode_cursor, limit=limit)
 
@@ -1,11 +1,11 @@
 """Suggestions blueprint for document suggestions."""
-from uuid import UUID
+from flask import Blueprint, request
 
-from flask import Blueprint, jsonify, request
-
-from src.config.database import SessionLocal
+from src.config.database import db_session
 from src.services.document_service import DocumentService
 from src.utils.auth import get_user_id_from_request, require_auth
+from src.utils.responses import YIELD_PER, json_list_response, orjson_response
+from src.utils.validation import parse_uuid
 
 suggestions_bp = Blueprint("suggestions", __name__, url_prefix="/api/suggestions")
 
@@ -24,27 +24,23 @@ def get_document_suggestions(document_id: str):
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
-
-    include_resolved = request.args.get("include_resolved", "false").lower() == "true"
-
-    db = SessionLocal()
+        return orjson_response({"error": "Unauthorized"}, 401)
 
-    try:
-        doc_uuid = UUID(document_id)
+    doc_uuid = parse_uuid(document_id)
+    if doc_uuid is None:
+        return orjson_response({"error": "Invalid document ID format"}, 400)
 
-        # Verify document ownership
-        document = DocumentService.get_document(db, doc_uuid, user_id)
-        if not document:
-            return jsonify({"error": "Document not found"}), 404
+    include_resolved = request.args.get("include_resolved", "false").lower() == "true"
 
-        suggestions = DocumentService.get_document_suggestions(db, doc_uuid, include_resolved)
-        return jsonify({"suggestions": [sug.to_dict() for sug in suggestions]}), 200
+    # Verify document ownership
+    document = DocumentService.get_document(db_session, doc_uuid, user_id)
+    if not document:
+        return orjson_response({"error": "Document not found"}, 404)
 
-    except ValueError:
-        return jsonify({"error": "Invalid document ID format"}), 400
-    finally:
-        db.close()
+    suggestions = DocumentService.get_document_suggestions(
+        db_session, doc_uuid, include_resolved, yield_per=YIELD_PER
+    )
+    return json_list_response(suggestions, "suggestions")
 
 
 @suggestions_bp.route("/<suggestion_id>/resolve", methods=["POST"])
@@ -58,21 +54,15 @@ def resolve_suggestion(suggestion_id: str):
     """
     user_id = get_user_id_from_request()
     if not user_id:
-        return jsonify({"error": "Unauthorized"}), 401
-
-    db = SessionLocal()
-
-    try:
-        sug_uuid = UUID(suggestion_id)
-        resolved = DocumentService.resolve_suggestion(db, sug_uuid)
+        return orjson_response({"error": "Unauthorized"}, 401)
 
-        if resolved:
-            return jsonify({"success": True, "id": suggestion_id}), 200
-        else:
-            return jsonify({"error": "Suggestion not found"}), 404
+    sug_uuid = parse_uuid(suggestion_id)
+    if sug_uuid is None:
+        return orjson_response({"error": "Invalid suggestion ID format"}, 400)
 
-    except ValueError:
-        return jsonify({"error": "Invalid suggestion ID format"}), 400
-    finally:
-        db.close()
+    resolved = DocumentService.resolve_suggestion(db_session, sug_uuid)
+    if resolved:
+        return orjson_response({"success": True, "id": suggestion_id}, 200)
+    else:
+        return orjson_response({"error": "Suggestion not found"}, 404)
 
@@ -1,6 +1,6 @@
 """Main Flask application factory."""
 import logging
-from flask import Flask, jsonify
+from flask import Flask, Response
 from flask_cors import CORS
 
 from src.api.blueprints.chat import chat_bp
@@ -10,7 +10,8 @@ from src.api.blueprints.history import history_bp
 from src.api.blueprints.suggestions import suggestions_bp
 from src.config.database import db_session
 from src.config.settings import settings
-from src.utils.errors import APIError
+from src.utils.errors import APIError, InternalServerError, NotFoundError
+from src.utils.responses import orjson_response
 
 
 def create_app():
@@ -29,7 +30,7 @@ def create_app():
     # CORS configuration
     CORS(
         app,
-        origins=settings.get_cors_origins(),
+        origins=settings.cors_origins,
         supports_credentials=True,
         allow_headers=["Content-Type", "Authorization", "X-API-Key", "X-User-Id"],
     )
@@ -51,18 +52,20 @@ def create_app():
     @app.errorhandler(APIError)
     def handle_api_error(error):
         """Handle API errors."""
-        return jsonify(error.to_dict()), error.status_code
+        return Response(
+            error.to_json_bytes(), status=error.status_code, mimetype="application/json"
+        )
 
     @app.errorhandler(404)
     def handle_not_found(error):
         """Handle 404 errors."""
-        return jsonify({"error": "Not found", "code": "not_found"}), 404
+        return handle_api_error(NotFoundError())
 
     @app.errorhandler(500)
     def handle_internal_error(error):
         """Handle 500 errors."""
         app.logger.error(f"Internal error: {error}")
-        return jsonify({"error": "Internal server error", "code": "internal_error"}), 500
+        return handle_api_error(InternalServerError())
 
     # Database session cleanup
     @app.teardown_appcontext
@@ -74,7 +77,7 @@ def create_app():
     @app.route("/")
     def root():
         """Root endpoint."""
-        return jsonify(
+        return orjson_response(
             {
                 "service": "Aether AI Backend",
                 "version": "0.1.0",
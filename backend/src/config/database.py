@@ -1,7 +1,11 @@
 """Database configuration and session management."""
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import JSON, DateTime, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.sql.expression import FunctionElement
 
 from src.config.settings import settings
 
@@ -9,9 +13,18 @@ from src.config.settings import settings
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    echo=settings.DEBUG,
+    # Reuse the most recently returned connection so idle extras can time out
+    pool_use_lifo=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_reset_on_return="rollback",
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    echo=settings.SQLALCHEMY_ECHO,
+    # Encode and decode JSON/JSONB columns with orjson instead of the stdlib json module
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
 )
 
 # Create session factory
@@ -24,6 +37,32 @@ db_session = scoped_session(SessionLocal)
 Base = declarative_base()
 Base.query = db_session.query_property()
 
+# Binary JSONB on PostgreSQL; plain JSON elsewhere so SQLite can create the schema
+JSONDocument = JSONB().with_variant(JSON(), "sqlite")
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    # Match the microsecond string format SQLAlchemy stores DateTime values in
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
 
 def init_db():
     """Initialize database - create all tables."""
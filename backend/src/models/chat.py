@@ -1,13 +1,11 @@
 """Chat model definition."""
-from datetime import datetime
 from typing import Optional
-from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, String, Text, UUID
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, DateTime, Index, String, Text, UUID
 from sqlalchemy.orm import relationship
 
-from src.config.database import Base
+from src.config.database import Base, JSONDocument, utcnow
+from src.utils.ids import uuid7
 
 
 class Chat(Base):
@@ -15,27 +13,41 @@ class Chat(Base):
 
     __tablename__ = "chats"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    # Fetch database-generated timestamps with RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     title = Column(Text, nullable=False)
     visibility = Column(String(20), default="private", nullable=False)
-    last_context = Column(JSONB, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    last_context = Column(JSONDocument, nullable=True)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+
+    # Backs the keyset-paginated "most recently updated chats for a user" listing
+    __table_args__ = (
+        Index("ix_chats_user_updated_id", user_id, updated_at.desc(), id.desc()),
+    )
 
     # Relationships
-    messages = relationship("Message", back_populates="chat", cascade="all, delete-orphan")
+    messages = relationship(
+        "Message",
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="[Message.created_at, Message.id]",
+    )
 
     def to_dict(self) -> dict:
         """Convert model to dictionary."""
         return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
+            "id": self.id,
+            "user_id": self.user_id,
             "title": self.title,
             "visibility": self.visibility,
             "last_context": self.last_context,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     def __repr__(self) -> str:
@@ -1,11 +1,16 @@
 """Document model definition."""
-from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, String, Text, UUID
+from sqlalchemy import Column, DateTime, Index, String, Text, UUID
 from sqlalchemy.orm import relationship
 
-from src.config.database import Base
+from src.config.database import Base, utcnow
+from src.utils.ids import uuid7
+
+# Kinds of document, in the order they are listed to users
+DOCUMENT_KINDS = ("text", "code", "image", "sheet")
+
+# Set of the same kinds for constant-time membership checks
+VALID_DOCUMENT_KINDS = frozenset(DOCUMENT_KINDS)
 
 
 class Document(Base):
@@ -13,29 +18,39 @@ class Document(Base):
 
     __tablename__ = "documents"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    # Fetch database-generated timestamps with RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     title = Column(Text, nullable=False)
     content = Column(Text, nullable=True)
     kind = Column(String(20), default="text", nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+
+    # Back the keyset-paginated "most recently updated documents for a user" listing,
+    # with and without kind
+    __table_args__ = (
+        Index("ix_documents_user_updated_id", user_id, updated_at.desc(), id.desc()),
+        Index("ix_documents_user_kind_updated_id", user_id, kind, updated_at.desc(), id.desc()),
+    )
 
     # Relationships
     suggestions = relationship(
-        "Suggestion", back_populates="document", cascade="all, delete-orphan"
+        "Suggestion", back_populates="document", cascade="all, delete-orphan", passive_deletes=True
     )
 
     def to_dict(self) -> dict:
         """Convert model to dictionary."""
         return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
+            "id": self.id,
+            "user_id": self.user_id,
             "title": self.title,
             "content": self.content,
             "kind": self.kind,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     def __repr__(self) -> str:
@@ -1,12 +1,10 @@
 """Message model definition."""
-from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, UUID
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, String, UUID
 from sqlalchemy.orm import relationship
 
-from src.config.database import Base
+from src.config.database import Base, JSONDocument, utcnow
+from src.utils.ids import uuid7
 
 
 class Message(Base):
@@ -14,12 +12,27 @@ class Message(Base):
 
     __tablename__ = "messages"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    chat_id = Column(UUID(as_uuid=True), ForeignKey("chats.id"), nullable=False, index=True)
+    # Fetch database-generated timestamps with RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    chat_id = Column(UUID(as_uuid=True), ForeignKey("chats.id", ondelete="CASCADE"), nullable=False)
     role = Column(String(20), nullable=False)
-    parts = Column(JSONB, nullable=False)
-    attachments = Column(JSONB, nullable=False, default=list)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    parts = Column(JSONDocument, nullable=False)
+    attachments = Column(JSONDocument, nullable=False, default=list)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+
+    __table_args__ = (
+        # Serves a chat's messages in order straight from the index
+        Index("ix_messages_chat_created", chat_id, created_at),
+        # The database rejects malformed payloads, so reads can trust the stored shape
+        CheckConstraint(
+            "jsonb_typeof(parts) = 'array'", name="ck_messages_parts_array"
+        ).ddl_if(dialect="postgresql"),
+        CheckConstraint(
+            "jsonb_typeof(attachments) = 'array'", name="ck_messages_attachments_array"
+        ).ddl_if(dialect="postgresql"),
+    )
 
     # Relationships
     chat = relationship("Chat", back_populates="messages")
@@ -27,12 +40,12 @@ class Message(Base):
     def to_dict(self) -> dict:
         """Convert model to dictionary."""
         return {
-            "id": str(self.id),
-            "chat_id": str(self.chat_id),
+            "id": self.id,
+            "chat_id": self.chat_id,
             "role": self.role,
             "parts": self.parts,
             "attachments": self.attachments,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
 
     def __repr__(self) -> str:
@@ -1,11 +1,10 @@
 """Suggestion model definition."""
-from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Text, UUID
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Text, UUID
 from sqlalchemy.orm import relationship
 
-from src.config.database import Base
+from src.config.database import Base, utcnow
+from src.utils.ids import uuid7
 
 
 class Suggestion(Base):
@@ -13,14 +12,31 @@ class Suggestion(Base):
 
     __tablename__ = "suggestions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id"), nullable=False, index=True)
+    # Fetch database-generated timestamps with RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    document_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("documents.id", ondelete="CASCADE"),
+        nullable=False,
+    )
     user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     original_text = Column(Text, nullable=False)
     suggested_text = Column(Text, nullable=False)
     description = Column(Text, nullable=True)
     is_resolved = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+
+    # Serves a document's (unresolved) suggestions newest first straight from the index
+    __table_args__ = (
+        Index(
+            "ix_suggestions_document_resolved_created",
+            document_id,
+            is_resolved,
+            created_at.desc(),
+        ),
+    )
 
     # Relationships
     document = relationship("Document", back_populates="suggestions")
@@ -28,14 +44,14 @@ class Suggestion(Base):
     def to_dict(self) -> dict:
         """Convert model to dictionary."""
         return {
-            "id": str(self.id),
-            "document_id": str(self.document_id),
-            "user_id": str(self.user_id),
+            "id": self.id,
+            "document_id": self.document_id,
+            "user_id": self.user_id,
             "original_text": self.original_text,
             "suggested_text": self.suggested_text,
             "description": self.description,
             "is_resolved": self.is_resolved,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
 
     def __repr__(self) -> str:
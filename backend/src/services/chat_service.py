@@ -1,12 +1,15 @@
 """Chat service for managing conversations."""
 from datetime import datetime
-from typing import List, Optional
-from uuid import UUID, uuid4
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, insert, lambda_stmt, select, tuple_, update
+from sqlalchemy.orm import Session, selectinload
 
+from src.config.database import utcnow
 from src.models.chat import Chat
 from src.models.message import Message
+from src.utils.ids import uuid7
 
 
 class ChatService:
@@ -14,7 +17,11 @@ class ChatService:
 
     @staticmethod
     def create_chat(
-        db: Session, user_id: UUID, title: str, visibility: str = "private"
+        db: Session,
+        user_id: UUID,
+        title: str,
+        visibility: str = "private",
+        commit: bool = True,
     ) -> Chat:
         """
         Create a new chat.
@@ -24,20 +31,25 @@ class ChatService:
             user_id: User ID
             title: Chat title
             visibility: Chat visibility (public/private)
+            commit: Commit immediately; pass False to only flush it and leave
+                the commit to the caller
 
         Returns:
             Created chat object
         """
-        chat = Chat(
-            id=uuid4(), user_id=user_id, title=title, visibility=visibility, created_at=datetime.utcnow()
-        )
+        chat = Chat(id=uuid7(), user_id=user_id, title=title, visibility=visibility)
         db.add(chat)
-        db.commit()
-        db.refresh(chat)
+        if commit:
+            db.commit()
+            db.refresh(chat)
+        else:
+            db.flush()
         return chat
 
     @staticmethod
-    def get_chat(db: Session, chat_id: UUID, user_id: UUID) -> Optional[Chat]:
+    def get_chat(
+        db: Session, chat_id: UUID, user_id: UUID, with_messages: bool = False
+    ) -> Optional[Chat]:
         """
         Get chat by ID and verify ownership.
 
@@ -45,14 +57,27 @@ class ChatService:
             db: Database session
             chat_id: Chat ID
             user_id: User ID for ownership verification
+            with_messages: Eager-load the chat's messages
 
         Returns:
             Chat object or None
         """
-        return db.query(Chat).filter(Chat.id == chat_id, Chat.user_id == user_id).first()
+        stmt = lambda_stmt(
+            lambda: select(Chat).where(Chat.id == chat_id, Chat.user_id == user_id)
+        )
+        if with_messages:
+            stmt += lambda s: s.options(selectinload(Chat.messages))
+        return db.scalars(stmt).first()
 
     @staticmethod
-    def get_user_chats(db: Session, user_id: UUID, limit: int = 50) -> List[Chat]:
+    def get_user_chats(
+        db: Session,
+        user_id: UUID,
+        limit: int = 50,
+        yield_per: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        with_relationships: bool = False,
+    ) -> Iterable[Chat]:
         """
         Get user's chat list.
 
@@ -60,18 +85,75 @@ class ChatService:
             db: Database session
             user_id: User ID
             limit: Maximum number of chats to return
+            yield_per: Stream rows in batches of this size instead of loading them all
+            cursor: (updated_at, id) of the last chat of the previous page; only
+                older chats are returned
+            with_relationships: Eager-load each chat's messages in one batched query
 
         Returns:
-            List of chat objects
+            List of chat objects, or a streaming iterator when yield_per is set
         """
-        return (
-            db.query(Chat)
-            .filter(Chat.user_id == user_id)
-            .order_by(Chat.updated_at.desc())
-            .limit(limit)
-            .all()
+        stmt = lambda_stmt(lambda: select(Chat).where(Chat.user_id == user_id))
+
+        if cursor:
+            cursor_updated_at, cursor_id = cursor
+            stmt += lambda s: s.where(
+                tuple_(Chat.updated_at, Chat.id) < tuple_(cursor_updated_at, cursor_id)
+            )
+
+        if with_relationships:
+            stmt += lambda s: s.options(selectinload(Chat.messages))
+
+        stmt += lambda s: s.order_by(Chat.updated_at.desc(), Chat.id.desc()).limit(limit)
+        if yield_per:
+            return db.scalars(stmt, execution_options={"yield_per": yield_per})
+        return db.scalars(stmt).all()
+
+    @staticmethod
+    def list_chats_lite(
+        db: Session,
+        user_id: UUID,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get user's chat list as plain dictionaries.
+
+        Selects the listing columns directly instead of hydrating ``Chat`` objects,
+        so no identity map or attribute instrumentation work is done per row. Rows
+        carry the same keys as ``Chat.to_dict``.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            limit: Maximum number of chats to return
+            cursor: (updated_at, id) of the last chat of the previous page; only
+                older chats are returned
+
+        Returns:
+            List of chat dictionaries, most recently updated first
+        """
+        stmt = lambda_stmt(
+            lambda: select(
+                Chat.id,
+                Chat.user_id,
+                Chat.title,
+                Chat.visibility,
+                Chat.last_context,
+                Chat.created_at,
+                Chat.updated_at,
+            ).where(Chat.user_id == user_id)
         )
 
+        if cursor:
+            cursor_updated_at, cursor_id = cursor
+            stmt += lambda s: s.where(
+                tuple_(Chat.updated_at, Chat.id) < tuple_(cursor_updated_at, cursor_id)
+            )
+
+        stmt += lambda s: s.order_by(Chat.updated_at.desc(), Chat.id.desc()).limit(limit)
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
     @staticmethod
     def delete_chat(db: Session, chat_id: UUID, user_id: UUID) -> bool:
         """
@@ -85,12 +167,39 @@ class ChatService:
         Returns:
             True if deleted, False otherwise
         """
-        chat = ChatService.get_chat(db, chat_id, user_id)
-        if chat:
-            db.delete(chat)
-            db.commit()
-            return True
-        return False
+        # One keyed DELETE; the database cascades to the chat's messages. Loaded
+        # instances are marked deleted in Python instead of being refreshed later.
+        result = db.execute(
+            delete(Chat)
+            .where(Chat.id == chat_id, Chat.user_id == user_id)
+            .execution_options(synchronize_session="evaluate")
+        )
+        db.commit()
+        return result.rowcount > 0
+
+    @staticmethod
+    def update_chat_title(db: Session, chat_id: UUID, title: str) -> bool:
+        """
+        Update chat's title.
+
+        Args:
+            db: Database session
+            chat_id: Chat ID
+            title: New title
+
+        Returns:
+            True if updated, False otherwise
+        """
+        result = db.execute(
+            lambda_stmt(
+                lambda: update(Chat)
+                .where(Chat.id == chat_id)
+                .values(title=title, updated_at=utcnow())
+                .execution_options(synchronize_session=False)
+            )
+        )
+        db.commit()
+        return result.rowcount > 0
 
     @staticmethod
     def update_chat_context(db: Session, chat_id: UUID, context: dict) -> bool:
@@ -105,13 +214,16 @@ class ChatService:
         Returns:
             True if updated, False otherwise
         """
-        chat = db.query(Chat).filter(Chat.id == chat_id).first()
-        if chat:
-            chat.last_context = context
-            chat.updated_at = datetime.utcnow()
-            db.commit()
-            return True
-        return False
+        result = db.execute(
+            lambda_stmt(
+                lambda: update(Chat)
+                .where(Chat.id == chat_id)
+                .values(last_context=context, updated_at=utcnow())
+                .execution_options(synchronize_session=False)
+            )
+        )
+        db.commit()
+        return result.rowcount > 0
 
     @staticmethod
     def add_message(
@@ -120,6 +232,7 @@ class ChatService:
         role: str,
         parts: list,
         attachments: Optional[list] = None,
+        commit: bool = True,
     ) -> Message:
         """
         Add a message to a chat.
@@ -130,31 +243,93 @@ class ChatService:
             role: Message role (user/assistant)
             parts: Message parts
             attachments: Optional attachments
+            commit: Commit immediately; pass False to leave it to the caller
 
         Returns:
             Created message object
         """
-        message = Message(
-            id=uuid4(),
-            chat_id=chat_id,
-            role=role,
-            parts=parts,
-            attachments=attachments or [],
-            created_at=datetime.utcnow(),
+        # INSERT ... RETURNING hands back the new row without a follow-up SELECT
+        message = db.scalar(
+            insert(Message)
+            .values(
+                id=uuid7(),
+                chat_id=chat_id,
+                role=role,
+                parts=parts,
+                attachments=attachments or [],
+            )
+            .returning(Message)
         )
-        db.add(message)
-        
-        # Update chat's updated_at timestamp
-        chat = db.query(Chat).filter(Chat.id == chat_id).first()
-        if chat:
-            chat.updated_at = datetime.utcnow()
-        
-        db.commit()
-        db.refresh(message)
+
+        ChatService._touch_chat(db, chat_id)
+
+        if commit:
+            db.commit()
         return message
 
     @staticmethod
-    def get_messages(db: Session, chat_id: UUID, limit: int = 100) -> List[Message]:
+    def add_messages_bulk(
+        db: Session, chat_id: UUID, messages: List[Dict[str, Any]], commit: bool = True
+    ) -> int:
+        """
+        Add several messages to a chat with one INSERT.
+
+        Args:
+            db: Database session
+            chat_id: Chat ID
+            messages: Message dictionaries with role, parts and optional attachments,
+                in conversation order
+            commit: Commit immediately; pass False to leave it to the caller
+
+        Returns:
+            Number of messages added
+        """
+        if not messages:
+            return 0
+
+        # The database stamps created_at, so the batch shares one timestamp;
+        # messages are read back in (created_at, id) order, and sorting the
+        # time-ordered IDs keeps the given order within the batch
+        ids = sorted(uuid7() for _ in messages)
+        db.execute(
+            insert(Message),
+            [
+                {
+                    "id": message_id,
+                    "chat_id": chat_id,
+                    "role": message["role"],
+                    "parts": message["parts"],
+                    "attachments": message.get("attachments") or [],
+                }
+                for message_id, message in zip(ids, messages)
+            ],
+        )
+        ChatService._touch_chat(db, chat_id)
+
+        if commit:
+            db.commit()
+        return len(messages)
+
+    @staticmethod
+    def _touch_chat(db: Session, chat_id: UUID) -> None:
+        """
+        Bump a chat's updated_at by primary key without loading the chat.
+
+        Args:
+            db: Database session
+            chat_id: Chat ID
+        """
+        db.execute(
+            update(Chat)
+            .where(Chat.id == chat_id)
+            .values(updated_at=utcnow())
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def get_messages(
+        db: Session, chat_id: UUID, limit: int = 100, yield_per: Optional[int] = None
+    ) -> Iterable[Message]:
         """
         Get messages for a chat.
 
@@ -162,15 +337,51 @@ class ChatService:
             db: Database session
             chat_id: Chat ID
             limit: Maximum number of messages to return
+            yield_per: Stream rows in batches of this size instead of loading them all
 
         Returns:
-            List of message objects
+            List of message objects, or a streaming iterator when yield_per is set
         """
-        return (
-            db.query(Message)
-            .filter(Message.chat_id == chat_id)
-            .order_by(Message.created_at.asc())
+        stmt = lambda_stmt(
+            lambda: select(Message)
+            .where(Message.chat_id == chat_id)
+            .order_by(Message.created_at, Message.id)
             .limit(limit)
-            .all()
         )
+        if yield_per:
+            return db.scalars(stmt, execution_options={"yield_per": yield_per})
+        return db.scalars(stmt).all()
+
+    @staticmethod
+    def get_messages_for_user(
+        db: Session, chat_id: UUID, user_id: UUID, limit: int = 100
+    ) -> Optional[List[Message]]:
+        """
+        Get messages for a chat, verifying ownership in the same query.
 
+        Args:
+            db: Database session
+            chat_id: Chat ID
+            user_id: User ID for ownership verification
+            limit: Maximum number of messages to return
+
+        Returns:
+            List of message objects, or None if the chat does not exist
+        """
+        messages = db.scalars(
+            lambda_stmt(
+                lambda: select(Message)
+                .join(Chat, Message.chat_id == Chat.id)
+                .where(Message.chat_id == chat_id, Chat.user_id == user_id)
+                .order_by(Message.created_at, Message.id)
+                .limit(limit)
+            )
+        ).all()
+        if messages:
+            return messages
+
+        # No rows: tell an empty chat apart from a missing one
+        chat_exists = db.scalar(
+            select(exists().where(Chat.id == chat_id, Chat.user_id == user_id))
+        )
+        return messages if chat_exists else None
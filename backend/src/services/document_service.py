@@ -1,12 +1,15 @@
 """Document service for managing artifacts."""
 from datetime import datetime
-from typing import List, Optional
-from uuid import UUID, uuid4
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, lambda_stmt, select, tuple_, update
+from sqlalchemy.orm import Session, selectinload
 
+from src.config.database import utcnow
 from src.models.document import Document
 from src.models.suggestion import Suggestion
+from src.utils.ids import uuid7
 
 
 class DocumentService:
@@ -30,12 +33,11 @@ class DocumentService:
             Created document object
         """
         document = Document(
-            id=uuid4(),
+            id=uuid7(),
             user_id=user_id,
             title=title,
             content=content,
             kind=kind,
-            created_at=datetime.utcnow(),
         )
         db.add(document)
         db.commit()
@@ -55,11 +57,61 @@ class DocumentService:
         Returns:
             Document object or None
         """
-        return (
-            db.query(Document)
-            .filter(Document.id == document_id, Document.user_id == user_id)
-            .first()
+        stmt = lambda_stmt(
+            lambda: select(Document).where(
+                Document.id == document_id, Document.user_id == user_id
+            )
         )
+        return db.scalars(stmt).first()
+
+    @staticmethod
+    def get_document_content(
+        db: Session, document_id: UUID, user_id: UUID
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Get just the kind and content of a document, verifying ownership.
+
+        Args:
+            db: Database session
+            document_id: Document ID
+            user_id: User ID for ownership verification
+
+        Returns:
+            (kind, content) tuple or None
+        """
+        stmt = lambda_stmt(
+            lambda: select(Document.kind, Document.content).where(
+                Document.id == document_id, Document.user_id == user_id
+            )
+        )
+        return db.execute(stmt).first()
+
+    @staticmethod
+    def get_document_source(
+        db: Session, document_id: UUID, user_id: UUID
+    ) -> Optional[Tuple[str, str, str]]:
+        """
+        Get the title, kind and content of a document that has content.
+
+        Empty documents are filtered out by the database, so a document that
+        cannot be worked on costs one lookup that returns no row.
+
+        Args:
+            db: Database session
+            document_id: Document ID
+            user_id: User ID for ownership verification
+
+        Returns:
+            (title, kind, content) tuple, or None if missing or empty
+        """
+        stmt = lambda_stmt(
+            lambda: select(Document.title, Document.kind, Document.content).where(
+                Document.id == document_id,
+                Document.user_id == user_id,
+                func.length(Document.content) > 0,
+            )
+        )
+        return db.execute(stmt).first()
 
     @staticmethod
     def update_document(
@@ -77,18 +129,36 @@ class DocumentService:
         Returns:
             Updated document object or None
         """
-        document = DocumentService.get_document(db, document_id, user_id)
-        if document:
-            document.content = content
-            document.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(document)
+        # UPDATE ... RETURNING checks ownership, writes and reads back the row in one
+        # round trip. It is not a lambda_stmt: a cached lambda statement would drop
+        # populate_existing, leaving instances the session already holds stale.
+        document = db.scalars(
+            update(Document)
+            .where(Document.id == document_id, Document.user_id == user_id)
+            .values(content=content, updated_at=utcnow())
+            .returning(Document)
+            .execution_options(populate_existing=True)
+        ).first()
+        if document is None:
+            # Nothing matched, so nothing was written
+            return None
+
+        # Detach the returned row so committing does not expire it and make the
+        # caller's next attribute access issue another SELECT
+        db.expunge(document)
+        db.commit()
         return document
 
     @staticmethod
     def get_user_documents(
-        db: Session, user_id: UUID, kind: Optional[str] = None, limit: int = 50
-    ) -> List[Document]:
+        db: Session,
+        user_id: UUID,
+        kind: Optional[str] = None,
+        limit: int = 50,
+        yield_per: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        with_relationships: bool = False,
+    ) -> Iterable[Document]:
         """
         Get user's documents.
 
@@ -97,16 +167,34 @@ class DocumentService:
             user_id: User ID
             kind: Optional filter by document kind
             limit: Maximum number of documents to return
+            yield_per: Stream rows in batches of this size instead of loading them all
+            cursor: (updated_at, id) of the last document of the previous page; only
+                older documents are returned
+            with_relationships: Eager-load each document's suggestions in one batched query
 
         Returns:
-            List of document objects
+            List of document objects, or a streaming iterator when yield_per is set
         """
-        query = db.query(Document).filter(Document.user_id == user_id)
+        # Optional filters are appended as separate lambdas so each combination
+        # keeps its own cached statement
+        stmt = lambda_stmt(lambda: select(Document).where(Document.user_id == user_id))
 
         if kind:
-            query = query.filter(Document.kind == kind)
+            stmt += lambda s: s.where(Document.kind == kind)
+
+        if cursor:
+            cursor_updated_at, cursor_id = cursor
+            stmt += lambda s: s.where(
+                tuple_(Document.updated_at, Document.id) < tuple_(cursor_updated_at, cursor_id)
+            )
 
-        return query.order_by(Document.updated_at.desc()).limit(limit).all()
+        if with_relationships:
+            stmt += lambda s: s.options(selectinload(Document.suggestions))
+
+        stmt += lambda s: s.order_by(Document.updated_at.desc(), Document.id.desc()).limit(limit)
+        if yield_per:
+            return db.scalars(stmt, execution_options={"yield_per": yield_per})
+        return db.scalars(stmt).all()
 
     @staticmethod
     def delete_document(db: Session, document_id: UUID, user_id: UUID) -> bool:
@@ -121,12 +209,15 @@ class DocumentService:
         Returns:
             True if deleted, False otherwise
         """
-        document = DocumentService.get_document(db, document_id, user_id)
-        if document:
-            db.delete(document)
-            db.commit()
-            return True
-        return False
+        # One keyed DELETE; the database cascades to the document's suggestions.
+        # Loaded instances are marked deleted in Python instead of being refreshed later.
+        result = db.execute(
+            delete(Document)
+            .where(Document.id == document_id, Document.user_id == user_id)
+            .execution_options(synchronize_session="evaluate")
+        )
+        db.commit()
+        return result.rowcount > 0
 
     @staticmethod
     def create_suggestion(
@@ -152,24 +243,70 @@ class DocumentService:
             Created suggestion object
         """
         suggestion = Suggestion(
-            id=uuid4(),
+            id=uuid7(),
             document_id=document_id,
             user_id=user_id,
             original_text=original_text,
             suggested_text=suggested_text,
             description=description,
             is_resolved=False,
-            created_at=datetime.utcnow(),
         )
         db.add(suggestion)
         db.commit()
         db.refresh(suggestion)
         return suggestion
 
+    @staticmethod
+    def create_suggestions_bulk(
+        db: Session,
+        document_id: UUID,
+        user_id: UUID,
+        suggestions: List[Dict[str, Any]],
+        commit: bool = True,
+    ) -> int:
+        """
+        Create several suggestions for a document with one INSERT and commit.
+
+        Args:
+            db: Database session
+            document_id: Document ID
+            user_id: User ID
+            suggestions: Suggestion dictionaries with original_text, suggested_text
+                and optional description
+            commit: Commit immediately; pass False to leave it to the caller
+
+        Returns:
+            Number of suggestions created
+        """
+        if not suggestions:
+            return 0
+
+        db.execute(
+            insert(Suggestion),
+            [
+                {
+                    "id": uuid7(),
+                    "document_id": document_id,
+                    "user_id": user_id,
+                    "original_text": suggestion["original_text"],
+                    "suggested_text": suggestion["suggested_text"],
+                    "description": suggestion.get("description"),
+                    "is_resolved": False,
+                }
+                for suggestion in suggestions
+            ],
+        )
+        if commit:
+            db.commit()
+        return len(suggestions)
+
     @staticmethod
     def get_document_suggestions(
-        db: Session, document_id: UUID, include_resolved: bool = False
-    ) -> List[Suggestion]:
+        db: Session,
+        document_id: UUID,
+        include_resolved: bool = False,
+        yield_per: Optional[int] = None,
+    ) -> Iterable[Suggestion]:
         """
         Get suggestions for a document.
 
@@ -177,16 +314,22 @@ class DocumentService:
             db: Database session
             document_id: Document ID
             include_resolved: Whether to include resolved suggestions
+            yield_per: Stream rows in batches of this size instead of loading them all
 
         Returns:
-            List of suggestion objects
+            List of suggestion objects, or a streaming iterator when yield_per is set
         """
-        query = db.query(Suggestion).filter(Suggestion.document_id == document_id)
+        stmt = lambda_stmt(
+            lambda: select(Suggestion).where(Suggestion.document_id == document_id)
+        )
 
         if not include_resolved:
-            query = query.filter(Suggestion.is_resolved == False)
+            stmt += lambda s: s.where(Suggestion.is_resolved == False)
 
-        return query.order_by(Suggestion.created_at.desc()).all()
+        stmt += lambda s: s.order_by(Suggestion.created_at.desc())
+        if yield_per:
+            return db.scalars(stmt, execution_options={"yield_per": yield_per})
+        return db.scalars(stmt).all()
 
     @staticmethod
     def resolve_suggestion(db: Session, suggestion_id: UUID) -> bool:
@@ -200,10 +343,12 @@ class DocumentService:
         Returns:
             True if resolved, False otherwise
         """
-        suggestion = db.query(Suggestion).filter(Suggestion.id == suggestion_id).first()
-        if suggestion:
-            suggestion.is_resolved = True
-            db.commit()
-            return True
-        return False
+        result = db.execute(
+            update(Suggestion)
+            .where(Suggestion.id == suggestion_id)
+            .values(is_resolved=True)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount > 0
 
@@ -0,0 +1,77 @@
+"""Shared HTTP client for outbound web calls.
+
+Services that call out to the web (embedding servers, search APIs, source
+pages, tool backends) go through ``async_client``, or ``session`` from
+synchronous code, rather than creating a client per call, so TCP/TLS
+handshakes are paid once and connections are reused across requests.
+"""
+import asyncio
+import atexit
+from typing import Iterable, List, Union
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils.event_loop import is_running, run_async
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - HTTP/2 support is optional
+    h2 = None
+
+# Per-request timeouts; a slow source must not stall a whole research step
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# Upper bounds on open and idle kept-alive connections
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+async_client = httpx.AsyncClient(
+    http2=h2 is not None,
+    limits=HTTP_LIMITS,
+    timeout=HTTP_TIMEOUT,
+    follow_redirects=True,
+)
+
+# Synchronous counterpart for code that cannot await. It is configured once here
+# and never mutated per request, so threads can share it.
+session = requests.Session()
+session.headers["User-Agent"] = "aether-ai-backend/0.1.0"
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+
+async def fetch_all(urls: Iterable[str]) -> List[Union[httpx.Response, Exception]]:
+    """
+    Fetch several URLs concurrently with the shared client.
+
+    Args:
+        urls: URLs to fetch
+
+    Returns:
+        Responses in the order of ``urls``; a failed fetch is returned as its
+        exception instead of aborting the others
+    """
+    return await asyncio.gather(*(async_client.get(url) for url in urls), return_exceptions=True)
+
+
+async def close_async_client():
+    """Close the shared client and its pooled connections on shutdown."""
+    await async_client.aclose()
+
+
+@atexit.register
+def _close_clients():
+    """Close both shared clients when the process exits."""
+    session.close()
+    # The async client is bound to the shared event loop; if that loop never
+    # started, the client never opened a connection
+    if is_running() and not async_client.is_closed:
+        run_async(close_async_client(), timeout=5)
@@ -1,27 +1,17 @@
 """LLM service for Ollama integration with LangChain."""
-from typing import Any, AsyncIterator, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
+import orjson
 from langchain_community.llms import Ollama
-from langchain_core.callbacks import AsyncCallbackHandler, CallbackManagerForLLMRun
+from langchain_core.callbacks import CallbackManagerForLLMRun
 from langchain_core.language_models import BaseLLM
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, AIMessage
 from langchain_core.outputs import GenerationChunk
+from ollama import AsyncClient
 
 from src.config.settings import settings
-
-
-class StreamingCallbackHandler(AsyncCallbackHandler):
-    """Callback handler for streaming responses."""
-
-    def __init__(self):
-        """Initialize callback handler."""
-        self.tokens = []
-
-    async def on_llm_new_token(
-        self, token: str, *, run_id, parent_run_id=None, **kwargs: Any
-    ) -> None:
-        """Handle new token from LLM."""
-        self.tokens.append(token)
+from src.utils.event_loop import iterate, run_async
 
 
 class OllamaModelRegistry:
@@ -65,6 +55,10 @@ class OllamaModelRegistry:
         },
     }
 
+    # The registry is static, so its listing and JSON encoding are built once
+    _MODELS_LIST = list(AVAILABLE_MODELS.values())
+    _MODELS_LIST_JSON = orjson.dumps({"models": _MODELS_LIST})
+
     @classmethod
     def get_model_info(cls, model_id: str) -> Optional[Dict[str, Any]]:
         """Get model information by ID."""
@@ -73,7 +67,12 @@ class OllamaModelRegistry:
     @classmethod
     def list_models(cls) -> List[Dict[str, Any]]:
         """List all available models."""
-        return list(cls.AVAILABLE_MODELS.values())
+        return cls._MODELS_LIST
+
+    @classmethod
+    def list_models_json_bytes(cls) -> bytes:
+        """List all available models as a serialized ``{"models": [...]}`` body."""
+        return cls._MODELS_LIST_JSON
 
     @classmethod
     def is_valid_model(cls, model_id: str) -> bool:
@@ -81,6 +80,77 @@ class OllamaModelRegistry:
         return model_id in cls.AVAILABLE_MODELS
 
 
+# Prompt labels of the roles included in the conversation history
+_ROLE_LABELS = {"user": "User", "assistant": "Assistant"}
+
+# Titles are a single short line; stop generating once the model moves past it
+TITLE_MAX_TOKENS = 16
+TITLE_STOP = ["\n", "User:"]
+
+
+@lru_cache(maxsize=32)
+def _get_client(host: str, model_id: str) -> Ollama:
+    """
+    Get the shared Ollama client for a host and model.
+
+    Clients are cached so their configuration is validated once per process;
+    temperature is passed per call, so one client serves every temperature.
+
+    Args:
+        host: Ollama base URL
+        model_id: Ollama model ID
+
+    Returns:
+        Ollama LLM instance
+    """
+    return Ollama(base_url=host, model=model_id, temperature=0.7)
+
+
+@lru_cache(maxsize=8)
+def _get_async_client(host: str) -> AsyncClient:
+    """
+    Get the shared async Ollama client for a host.
+
+    Async calls all run on the process-wide background event loop, so a single
+    client and its connection pool serve every stream and request.
+
+    Args:
+        host: Ollama base URL
+
+    Returns:
+        Async Ollama client
+    """
+    return AsyncClient(host=host)
+
+
+@lru_cache(maxsize=256)
+def _generate_title(host: str, model_id: str, user_message: str) -> str:
+    """
+    Generate a chat title, stopping the model at the end of the first line.
+
+    Args:
+        host: Ollama base URL
+        model_id: Ollama model ID
+        user_message: The user's first message
+
+    Returns:
+        Generated title
+    """
+    llm = _get_client(host, model_id)
+
+    prompt = f"""Generate a short, concise title (max 6 words) for a conversation that starts with:
+
+User: {user_message}
+
+Title:"""
+
+    response = llm.invoke(
+        prompt, stop=TITLE_STOP, temperature=0.5, num_predict=TITLE_MAX_TOKENS
+    )
+    # Clean up the response
+    return response.strip().strip('"').strip("'")
+
+
 class LLMService:
     """Service for managing LLM interactions."""
 
@@ -93,17 +163,23 @@ class LLMService:
         """
         self.model_id = model_id or settings.OLLAMA_DEFAULT_MODEL
         self.ollama_host = settings.OLLAMA_HOST
-        self._llm = None
-
-    def _get_llm(self) -> Ollama:
-        """Get or create Ollama LLM instance."""
-        if self._llm is None:
-            self._llm = Ollama(
-                base_url=self.ollama_host,
-                model=self.model_id,
-                temperature=0.7,
+
+    @staticmethod
+    def _message_text(msg: Dict[str, Any]) -> str:
+        """
+        Extract the text of a message.
+
+        Args:
+            msg: Message dictionary with either parts or direct content
+
+        Returns:
+            Joined text parts, or the direct content
+        """
+        if "parts" in msg:
+            return "".join(
+                part.get("text", "") for part in msg["parts"] if part.get("type") == "text"
             )
-        return self._llm
+        return msg.get("content", "")
 
     def _convert_messages_to_prompt(
         self, messages: List[Dict[str, Any]], system_prompt: Optional[str] = None
@@ -118,29 +194,16 @@ class LLMService:
         Returns:
             Formatted prompt string
         """
-        prompt_parts = []
-
-        if system_prompt:
-            prompt_parts.append(f"System: {system_prompt}\n")
-
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = ""
-
-            # Handle parts-based content
-            if "parts" in msg:
-                for part in msg["parts"]:
-                    if part.get("type") == "text":
-                        content += part.get("text", "")
-            # Handle direct content
-            elif "content" in msg:
-                content = msg["content"]
-
-            if content:
-                if role == "user":
-                    prompt_parts.append(f"User: {content}")
-                elif role == "assistant":
-                    prompt_parts.append(f"Assistant: {content}")
+        prompt_parts = [f"System: {system_prompt}\n"] if system_prompt else []
+
+        # Unknown roles and messages without text are left out of the prompt
+        prompt_parts.extend(
+            f"{_ROLE_LABELS[role]}: {content}"
+            for role, content in (
+                (msg.get("role", "user"), self._message_text(msg)) for msg in messages
+            )
+            if content and role in _ROLE_LABELS
+        )
 
         prompt_parts.append("Assistant:")
         return "\n\n".join(prompt_parts)
@@ -162,18 +225,46 @@ class LLMService:
         Yields:
             Token strings as they are generated
         """
-        llm = Ollama(
-            base_url=self.ollama_host,
+        prompt = self._convert_messages_to_prompt(messages, system_prompt)
+
+        # Must be awaited on the shared background loop, which owns the client's connections
+        stream = await _get_async_client(self.ollama_host).generate(
             model=self.model_id,
-            temperature=temperature,
+            prompt=prompt,
+            stream=True,
+            options={"temperature": temperature},
         )
 
-        prompt = self._convert_messages_to_prompt(messages, system_prompt)
+        # Stream tokens; closing the stream early releases its connection right away
+        try:
+            async for part in stream:
+                token = part.get("response")
+                if token:
+                    yield token
+        finally:
+            await stream.aclose()
+
+    def stream_chat_sync(
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> Iterator[str]:
+        """
+        Stream chat responses from synchronous code.
 
-        # Stream tokens
-        for chunk in llm.stream(prompt):
-            if chunk:
-                yield chunk
+        The stream runs as one task on the shared event loop through the async
+        client, and tokens are handed to the calling thread through a queue.
+
+        Args:
+            messages: List of message dictionaries
+            system_prompt: Optional system prompt
+            temperature: Temperature for generation
+
+        Returns:
+            Iterator of token strings as they are generated
+        """
+        return iterate(self.stream_chat(messages, system_prompt, temperature))
 
     def generate_chat(
         self,
@@ -192,47 +283,50 @@ class LLMService:
         Returns:
             Generated response text
         """
-        llm = Ollama(
-            base_url=self.ollama_host,
-            model=self.model_id,
-            temperature=temperature,
-        )
-
-        prompt = self._convert_messages_to_prompt(messages, system_prompt)
-        response = llm.invoke(prompt)
-
-        return response
+        # The request runs on the shared event loop; only this thread waits on it
+        return run_async(self.agenerate_chat(messages, system_prompt, temperature))
 
-    def generate_title(self, user_message: str) -> str:
+    async def agenerate_chat(
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> str:
         """
-        Generate a title for a chat based on the first user message.
+        Generate chat response (non-streaming) without blocking the event loop.
+
+        Must be awaited on the shared background event loop.
 
         Args:
-            user_message: The user's first message
+            messages: List of message dictionaries
+            system_prompt: Optional system prompt
+            temperature: Temperature for generation
 
         Returns:
-            Generated title
+            Generated response text
         """
-        llm = Ollama(
-            base_url=self.ollama_host,
+        prompt = self._convert_messages_to_prompt(messages, system_prompt)
+        response = await _get_async_client(self.ollama_host).generate(
             model=self.model_id,
-            temperature=0.5,
+            prompt=prompt,
+            options={"temperature": temperature},
         )
+        return response["response"]
 
-        prompt = f"""Generate a short, concise title (max 6 words) for a conversation that starts with:
-
-User: {user_message}
+    def generate_title(self, user_message: str) -> str:
+        """
+        Generate a title for a chat based on the first user message.
 
-Title:"""
+        Titles are cached per model and message, since new chats often start
+        with the same greeting.
 
-        response = llm.invoke(prompt)
-        # Clean up the response
-        title = response.strip().strip('"').strip("'")
-        # Limit to 60 characters
-        if len(title) > 60:
-            title = title[:57] + "..."
+        Args:
+            user_message: The user's first message
 
-        return title
+        Returns:
+            Generated title
+        """
+        return _generate_title(self.ollama_host, self.model_id, user_message)
 
     @staticmethod
     def list_available_models() -> List[Dict[str, Any]]:
@@ -244,6 +338,16 @@ Title:"""
         """
         return OllamaModelRegistry.list_models()
 
+    @staticmethod
+    def list_available_models_json() -> bytes:
+        """
+        List all available models as JSON.
+
+        Returns:
+            Serialized ``{"models": [...]}`` body
+        """
+        return OllamaModelRegistry.list_models_json_bytes()
+
     @staticmethod
     def get_model_info(model_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -257,3 +361,19 @@ Title:"""
         """
         return OllamaModelRegistry.get_model_info(model_id)
 
+
+@lru_cache(maxsize=16)
+def get_llm_service(model_id: Optional[str] = None) -> LLMService:
+    """
+    Get the shared LLM service for a model.
+
+    Services are cached per model so they are built once per process instead
+    of on every request.
+
+    Args:
+        model_id: Ollama model ID to use
+
+    Returns:
+        LLM service instance
+    """
+    return LLMService(model_id)
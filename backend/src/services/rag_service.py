@@ -10,6 +10,9 @@ Future implementation:
 - Vector database integration (ChromaDB or FAISS)
 - Semantic search and retrieval
 - Context injection into LLM prompts
+
+Calls to remote embedding servers go through the shared ``async_client`` from
+``src.services.http_client``; never create an HTTP client per call.
 """
 from typing import List, Optional
 
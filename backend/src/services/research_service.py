@@ -10,9 +10,14 @@ Future implementation:
 - Citation tracking and source verification
 - Iterative refinement of research questions
 - Knowledge graph generation
+
+All web requests go through the shared ``async_client`` from
+``src.services.http_client``; never create an HTTP client per call.
 """
 from typing import List, Optional
 
+from src.services.http_client import fetch_all
+
 # Future imports:
 # from langchain.agents import AgentExecutor, create_react_agent
 # from langchain_community.tools import DuckDuckGoSearchRun
@@ -63,7 +68,7 @@ class ResearchService:
 
         TODO: Implement topic research
         - Break down research question
-        - Search multiple sources
+        - Search multiple sources concurrently with ``fetch_sources``
         - Synthesize findings
         - Generate citations
         - Verify information
@@ -87,7 +92,7 @@ class ResearchService:
             List of search results
 
         TODO: Implement web search
-        - Use DuckDuckGo or Brave API
+        - Query DuckDuckGo or Brave API through the shared ``async_client``
         - Parse results
         - Extract relevant content
         - Rank by relevance
@@ -105,7 +110,7 @@ class ResearchService:
             Document analysis with key points and summary
 
         TODO: Implement document analysis
-        - Fetch and parse document
+        - Fetch the document with the shared ``async_client`` and parse it
         - Extract key information
         - Summarize content
         - Identify main arguments
@@ -117,6 +122,26 @@ class ResearchService:
             "entities": [],
         }
 
+    async def fetch_sources(self, source_urls: List[str]) -> List[str]:
+        """
+        Fetch several sources concurrently.
+
+        The requests run in parallel so their network latency overlaps instead
+        of adding up; sources that fail to load are skipped.
+
+        Args:
+            source_urls: URLs of the sources to fetch
+
+        Returns:
+            Text of each source that loaded successfully
+        """
+        responses = await fetch_all(source_urls)
+        return [
+            response.text
+            for response in responses
+            if not isinstance(response, Exception) and response.is_success
+        ]
+
     def verify_claim(self, claim: str) -> dict:
         """
         Verify a factual claim.
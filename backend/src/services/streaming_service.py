@@ -1,13 +1,50 @@
 """Service for SSE streaming."""
-import json
-from typing import AsyncIterator, Dict, Any
+import asyncio
+from typing import AsyncIterator, Dict, Any, Optional
+
+import orjson
+
+# Precomposed "event:"/"data:" headers of the event types this service emits
+_EVENT_PREFIXES = {
+    event: b"event: " + event.encode() + b"\ndata: "
+    for event in ("message", "error", "tool", "data")
+}
+_FRAME_END = b"\n\n"
+
+# Fixed framing around the content of a text-delta event
+_TEXT_DELTA_PREFIX = _EVENT_PREFIXES["message"] + b'{"type":"text-delta","content":'
+_TEXT_DELTA_SUFFIX = b"}" + _FRAME_END
+
+# Complete message-start/message-finish frames; only the IDs are filled in per stream
+_MESSAGE_START = _EVENT_PREFIXES["message"] + b'{"type":"message-start","id":"%s"}' + _FRAME_END
+_MESSAGE_START_IN_CHAT = (
+    _EVENT_PREFIXES["message"]
+    + b'{"type":"message-start","id":"%s","chat_id":"%s"}'
+    + _FRAME_END
+)
+_MESSAGE_FINISH = _EVENT_PREFIXES["message"] + b'{"type":"message-finish","id":"%s"}' + _FRAME_END
 
 
 class SSEService:
     """Service for Server-Sent Events streaming."""
 
+    # Headers for SSE responses (disable caching and proxy buffering)
+    RESPONSE_HEADERS = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+        "Connection": "keep-alive",
+    }
+
+    # Seconds of silence before a keep-alive comment is sent
+    PING_INTERVAL = 15.0
+
+    # Buffered text-delta characters / tokens / seconds before a batch is flushed
+    FLUSH_SIZE = 64
+    FLUSH_TOKENS = 8
+    FLUSH_INTERVAL = 0.02
+
     @staticmethod
-    def format_sse(data: Dict[str, Any], event: str = "message") -> str:
+    def format_sse(data: Dict[str, Any], event: str = "message") -> bytes:
         """
         Format data as SSE message.
 
@@ -16,15 +53,142 @@ class SSEService:
             event: Event type
 
         Returns:
-            Formatted SSE string
+            Formatted SSE bytes
+        """
+        prefix = _EVENT_PREFIXES.get(event)
+        if prefix is None:
+            prefix = b"event: " + event.encode() + b"\ndata: "
+        return prefix + orjson.dumps(data) + _FRAME_END
+
+    @staticmethod
+    def text_delta(content: str) -> bytes:
+        """
+        Format a text-delta SSE message as bytes.
+
+        Fast path for the per-token event: only the content is serialized,
+        the surrounding frame is fixed.
+
+        Args:
+            content: Text to send
+
+        Returns:
+            Formatted SSE bytes
+        """
+        return _TEXT_DELTA_PREFIX + orjson.dumps(content) + _TEXT_DELTA_SUFFIX
+
+    @staticmethod
+    def message_start(message_id: str, chat_id: Optional[str] = None) -> bytes:
+        """
+        Format a message-start SSE message as bytes.
+
+        The frame is filled in from a precomposed template instead of being
+        serialized; IDs are UUID strings, which need no JSON escaping.
+
+        Args:
+            message_id: ID of the message being generated
+            chat_id: Optional ID of the chat the message belongs to
+
+        Returns:
+            Formatted SSE bytes
+        """
+        if chat_id is None:
+            return _MESSAGE_START % message_id.encode()
+        return _MESSAGE_START_IN_CHAT % (message_id.encode(), chat_id.encode())
+
+    @staticmethod
+    def message_finish(message_id: str) -> bytes:
+        """
+        Format a message-finish SSE message as bytes.
+
+        Args:
+            message_id: ID of the message that was generated
+
+        Returns:
+            Formatted SSE bytes
         """
-        lines = [f"event: {event}", f"data: {json.dumps(data)}", ""]
-        return "\n".join(lines) + "\n"
+        return _MESSAGE_FINISH % message_id.encode()
+
+    @staticmethod
+    async def coalesce_tokens(tokens: AsyncIterator[str]) -> AsyncIterator[str]:
+        """
+        Coalesce streamed tokens into fewer, larger text chunks.
+
+        The first token is passed through on its own so the reply starts
+        rendering immediately. After that, tokens are buffered until
+        FLUSH_TOKENS tokens or FLUSH_SIZE characters have accumulated, or
+        FLUSH_INTERVAL seconds have passed since the first buffered token,
+        whichever comes first. The timer races the next token, so a stalled
+        model does not hold back text that already arrived.
+
+        Args:
+            tokens: Async iterator of token strings
+
+        Yields:
+            Joined text chunks
+        """
+        loop = asyncio.get_running_loop()
+        iterator = tokens.__aiter__()
+        batch = []
+        batch_size = 0
+        deadline = None
+        first = True
+        pending = asyncio.ensure_future(iterator.__anext__())
+
+        try:
+            while True:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    # Flush interval elapsed while waiting for the next token
+                    yield "".join(batch)
+                    batch.clear()
+                    batch_size = 0
+                    deadline = None
+                    continue
+
+                try:
+                    token = pending.result()
+                except StopAsyncIteration:
+                    break
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+                if first:
+                    first = False
+                    yield token
+                    continue
+
+                batch.append(token)
+                batch_size += len(token)
+                if deadline is None:
+                    deadline = loop.time() + SSEService.FLUSH_INTERVAL
+                if len(batch) >= SSEService.FLUSH_TOKENS or batch_size >= SSEService.FLUSH_SIZE:
+                    yield "".join(batch)
+                    batch.clear()
+                    batch_size = 0
+                    deadline = None
+        finally:
+            pending.cancel()
+
+        if batch:
+            yield "".join(batch)
+
+    @staticmethod
+    def ping() -> bytes:
+        """
+        Format a keep-alive comment.
+
+        Comment lines are ignored by SSE clients but keep proxies from
+        closing an idle connection while the model is still thinking.
+
+        Returns:
+            SSE comment bytes
+        """
+        return b": ping\n\n"
 
     @staticmethod
     async def stream_chat_response(
         tokens: AsyncIterator[str], message_id: str
-    ) -> AsyncIterator[str]:
+    ) -> AsyncIterator[bytes]:
         """
         Stream chat response tokens as SSE events.
 
@@ -33,26 +197,20 @@ class SSEService:
             message_id: ID of the message being generated
 
         Yields:
-            SSE-formatted strings
+            SSE-formatted bytes
         """
         # Send initial message start event
-        yield SSEService.format_sse(
-            {"type": "message-start", "id": message_id}, event="message"
-        )
+        yield SSEService.message_start(message_id)
 
-        # Stream tokens
-        async for token in tokens:
-            yield SSEService.format_sse(
-                {"type": "text-delta", "content": token}, event="message"
-            )
+        # Stream tokens, coalesced into fewer frames
+        async for text in SSEService.coalesce_tokens(tokens):
+            yield SSEService.text_delta(text)
 
         # Send message finish event
-        yield SSEService.format_sse(
-            {"type": "message-finish", "id": message_id}, event="message"
-        )
+        yield SSEService.message_finish(message_id)
 
     @staticmethod
-    def stream_error(error_message: str, error_code: str = "internal_error") -> str:
+    def stream_error(error_message: str, error_code: str = "internal_error") -> bytes:
         """
         Format error as SSE message.
 
@@ -61,14 +219,14 @@ class SSEService:
             error_code: Error code
 
         Returns:
-            SSE-formatted error string
+            SSE-formatted error bytes
         """
         return SSEService.format_sse(
             {"type": "error", "error": error_message, "code": error_code}, event="error"
         )
 
     @staticmethod
-    def stream_tool_call(tool_name: str, tool_input: Dict[str, Any]) -> str:
+    def stream_tool_call(tool_name: str, tool_input: Dict[str, Any]) -> bytes:
         """
         Format tool call as SSE message.
 
@@ -77,14 +235,14 @@ class SSEService:
             tool_input: Input parameters for the tool
 
         Returns:
-            SSE-formatted tool call string
+            SSE-formatted tool call bytes
         """
         return SSEService.format_sse(
             {"type": "tool-call", "tool": tool_name, "input": tool_input}, event="tool"
         )
 
     @staticmethod
-    def stream_tool_result(tool_name: str, tool_output: Any) -> str:
+    def stream_tool_result(tool_name: str, tool_output: Any) -> bytes:
         """
         Format tool result as SSE message.
 
@@ -93,14 +251,14 @@ class SSEService:
             tool_output: Output from the tool
 
         Returns:
-            SSE-formatted tool result string
+            SSE-formatted tool result bytes
         """
         return SSEService.format_sse(
             {"type": "tool-result", "tool": tool_name, "output": tool_output}, event="tool"
         )
 
     @staticmethod
-    def stream_data(data_type: str, data: Any) -> str:
+    def stream_data(data_type: str, data: Any) -> bytes:
         """
         Format custom data as SSE message.
 
@@ -109,7 +267,7 @@ class SSEService:
             data: Data payload
 
         Returns:
-            SSE-formatted data string
+            SSE-formatted data bytes
         """
         return SSEService.format_sse(
             {"type": f"data-{data_type}", "data": data}, event="data"
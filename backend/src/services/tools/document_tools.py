@@ -1,12 +1,244 @@
 """Document tools for LangChain."""
-from typing import Any, Dict, Optional
+import asyncio
+import io
+import re
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from langchain_core.tools import tool
 from sqlalchemy.orm import Session
 
+from src.models.document import DOCUMENT_KINDS, VALID_DOCUMENT_KINDS
 from src.services.document_service import DocumentService
 from src.services.llm_service import LLMService
+from src.utils.event_loop import iterate
+from src.utils.validation import parse_uuid
+
+# Suggestions requested per document, and the most parts a document is split into
+MAX_SUGGESTIONS = 5
+MAX_SUGGESTION_CHUNKS = 5
+
+_INVALID_KIND_ERROR = f"Invalid document kind. Must be one of: {', '.join(DOCUMENT_KINDS)}"
+
+# Sentinel a part's generation queues once its stream has ended
+_GENERATION_DONE = object()
+
+# One "FIELD: value" line of a suggestion, with surrounding whitespace trimmed
+_SUGGESTION_FIELD_RE = re.compile(r"\s*(ORIGINAL|SUGGESTED|REASON):\s*(.*?)\s*\Z")
+
+# Static instructions go in the system prompt so every call shares the same prompt
+# prefix, which the model server can reuse; only the short request part varies
+_SUGGEST_SYSTEM = """You are a helpful writing assistant. Given a piece of writing, please offer suggestions to improve it.
+
+For each suggestion:
+- Include the original sentence/phrase
+- Provide the suggested improvement
+- Explain why this change improves the text
+
+Format each suggestion as:
+ORIGINAL: [original text]
+SUGGESTED: [suggested text]
+REASON: [explanation]"""
+
+_SUGGEST_REQUEST = "Provide up to {count} suggestions for this text:\n\n{content}"
+
+_UPDATE_SYSTEM = (
+    "You update documents. Given a description of the changes that need to be made "
+    "and the current content of a document, generate the updated content."
+)
+
+_UPDATE_REQUEST = "Description: {description}\n\nCurrent content of the {kind} document:\n{content}"
+
+
+def _split_into_chunks(content: str, max_chunks: int) -> List[str]:
+    """
+    Split document content into at most ``max_chunks`` runs of whole paragraphs.
+
+    Args:
+        content: Document content
+        max_chunks: Maximum number of chunks
+
+    Returns:
+        Non-empty chunks in document order
+    """
+    paragraphs = [paragraph for paragraph in content.split("\n\n") if paragraph.strip()]
+    if not paragraphs:
+        return []
+
+    per_chunk = -(-len(paragraphs) // max_chunks)
+    return [
+        "\n\n".join(paragraphs[start : start + per_chunk])
+        for start in range(0, len(paragraphs), per_chunk)
+    ]
+
+
+def _complete_lines(buffer: str, token: str) -> Tuple[List[str], str]:
+    """
+    Add a streamed token to a line buffer.
+
+    Args:
+        buffer: Unterminated text of the current line
+        token: Next streamed token
+
+    Returns:
+        Lines completed by the token, and the new unterminated buffer
+    """
+    buffer += token
+    if "\n" not in buffer:
+        return [], buffer
+    *lines, buffer = buffer.split("\n")
+    return lines, buffer
+
+
+def _iter_lines(tokens: Iterable[str]) -> Iterator[str]:
+    """
+    Reassemble streamed tokens into complete lines.
+
+    Args:
+        tokens: Streamed token strings
+
+    Yields:
+        Each line as soon as its newline arrives, then any unterminated last line
+    """
+    buffer = ""
+    for token in tokens:
+        lines, buffer = _complete_lines(buffer, token)
+        yield from lines
+    if buffer:
+        yield buffer
+
+
+def _parse_suggestion_line(block: Dict[str, str], line: str) -> Optional[Dict[str, str]]:
+    """
+    Add one line of a suggestions response to the block being parsed.
+
+    A field repeated within a block keeps its last value. A REASON line ends
+    the block; if ORIGINAL or SUGGESTED is missing, the block is dropped.
+
+    Args:
+        block: Fields of the current block so far, updated in place
+        line: Next line of the LLM response
+
+    Returns:
+        Suggestion dictionary with original_text, suggested_text and description
+        once a REASON line completes it, otherwise None
+    """
+    match = _SUGGESTION_FIELD_RE.match(line)
+    if match is None:
+        return None
+    field, value = match.groups()
+    block[field] = value
+    if field != "REASON":
+        return None
+
+    # If we have all parts, emit the suggestion
+    suggestion = None
+    if block.keys() >= {"ORIGINAL", "SUGGESTED"}:
+        suggestion = {
+            "original_text": block["ORIGINAL"],
+            "suggested_text": block["SUGGESTED"],
+            "description": value,
+        }
+    block.clear()
+    return suggestion
+
+
+def _parse_suggestions(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """
+    Parse the ORIGINAL/SUGGESTED/REASON blocks of a suggestions response.
+
+    Args:
+        lines: Lines of the LLM response, possibly still being generated
+
+    Yields:
+        Suggestion dictionaries, each as soon as its REASON line is complete
+    """
+    block = {}
+    for line in lines:
+        suggestion = _parse_suggestion_line(block, line)
+        if suggestion:
+            yield suggestion
+
+
+async def _stream_suggestions(
+    llm_service: LLMService, conversation: List[Dict[str, Any]], found: asyncio.Queue
+) -> None:
+    """
+    Stream one part's suggestions into a queue.
+
+    Args:
+        llm_service: LLM service for generating suggestions
+        conversation: Request for the part
+        found: Queue receiving each suggestion as soon as its REASON line is
+            complete, then _GENERATION_DONE
+    """
+    buffer = ""
+    block = {}
+    try:
+        async for token in llm_service.stream_chat(
+            conversation, system_prompt=_SUGGEST_SYSTEM, temperature=0.7
+        ):
+            lines, buffer = _complete_lines(buffer, token)
+            for line in lines:
+                suggestion = _parse_suggestion_line(block, line)
+                if suggestion:
+                    found.put_nowait(suggestion)
+        suggestion = _parse_suggestion_line(block, buffer)
+        if suggestion:
+            found.put_nowait(suggestion)
+    finally:
+        found.put_nowait(_GENERATION_DONE)
+
+
+async def _generate_suggestions(
+    llm_service: LLMService, conversations: List[List[Dict[str, Any]]]
+) -> AsyncIterator[List[Dict[str, str]]]:
+    """
+    Generate suggestions for every part of a document concurrently.
+
+    Must run on the shared background event loop. Every part streams as its
+    own task; closing the generator early cancels the parts still running.
+
+    Args:
+        llm_service: LLM service for generating suggestions
+        conversations: One request per document part
+
+    Yields:
+        Batches of the suggestions that arrived since the previous batch
+
+    Raises:
+        The first error of a part that failed
+    """
+    found = asyncio.Queue()
+    tasks = [
+        asyncio.ensure_future(_stream_suggestions(llm_service, conversation, found))
+        for conversation in conversations
+    ]
+
+    try:
+        running = len(tasks)
+        while running:
+            # Wait for the next suggestion, then take whatever else already arrived
+            batch = []
+            item = await found.get()
+            while True:
+                if item is _GENERATION_DONE:
+                    running -= 1
+                else:
+                    batch.append(item)
+                try:
+                    item = found.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            if batch:
+                yield batch
+
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.cancel() and not task.cancelled():
+                # Parts that failed after enough suggestions arrived are not reported
+                task.exception()
 
 
 def create_document_tool(db: Session, user_id: UUID):
@@ -34,11 +266,8 @@ def create_document_tool(db: Session, user_id: UUID):
             Created document information
         """
         # Validate kind
-        valid_kinds = ["text", "code", "image", "sheet"]
-        if kind not in valid_kinds:
-            return {
-                "error": f"Invalid document kind. Must be one of: {', '.join(valid_kinds)}"
-            }
+        if kind not in VALID_DOCUMENT_KINDS:
+            return {"error": _INVALID_KIND_ERROR}
 
         # Create document
         document = DocumentService.create_document(
@@ -80,33 +309,37 @@ def update_document_tool(db: Session, user_id: UUID, llm_service: LLMService):
         Returns:
             Updated document information
         """
-        try:
-            doc_uuid = UUID(document_id)
-        except ValueError:
+        doc_uuid = parse_uuid(document_id)
+        if doc_uuid is None:
             return {"error": "Invalid document ID format"}
 
-        # Get document
-        document = DocumentService.get_document(db, doc_uuid, user_id)
-        if not document:
+        # Only the kind and content are needed to build the prompt
+        source = DocumentService.get_document_content(db, doc_uuid, user_id)
+        if not source:
             return {"error": "Document not found"}
+        kind, content = source
 
         # Generate updated content using LLM
-        prompt = f"""Update the following {document.kind} document based on this description:
-
-Description: {description}
-
-Current content:
-{document.content}
-
-Generate the updated content:"""
+        prompt = _UPDATE_REQUEST.format(description=description, kind=kind, content=content)
 
         try:
-            updated_content = llm_service.generate_chat(
-                messages=[{"role": "user", "content": prompt}], temperature=0.3
+            # Tokens are streamed over the shared event loop and appended to one
+            # growable buffer as they arrive
+            updated_content = io.StringIO()
+            for token in llm_service.stream_chat_sync(
+                messages=[{"role": "user", "content": prompt}],
+                system_prompt=_UPDATE_SYSTEM,
+                temperature=0.3,
+            ):
+                updated_content.write(token)
+
+            # Written once the reply is complete, so readers never see a half-updated
+            # document; the update reads the row back in the same statement
+            document = DocumentService.update_document(
+                db, doc_uuid, user_id, updated_content.getvalue()
             )
-
-            # Update document
-            document = DocumentService.update_document(db, doc_uuid, user_id, updated_content)
+            if not document:
+                return {"error": "Document not found"}
 
             return {
                 "id": str(document.id),
@@ -144,75 +377,59 @@ def request_suggestions_tool(db: Session, user_id: UUID, llm_service: LLMService
         Returns:
             Suggestions information
         """
-        try:
-            doc_uuid = UUID(document_id)
-        except ValueError:
+        doc_uuid = parse_uuid(document_id)
+        if doc_uuid is None:
             return {"error": "Invalid document ID format"}
 
-        # Get document
-        document = DocumentService.get_document(db, doc_uuid, user_id)
-        if not document or not document.content:
+        # Only the columns the prompt and reply need; empty documents are rejected
+        # by the query. A plain row is not expired by the commit below, so reading
+        # the title afterwards does not load the document again.
+        source = DocumentService.get_document_source(db, doc_uuid, user_id)
+        if not source:
             return {"error": "Document not found or has no content"}
+        title, kind, content = source
 
-        # Generate suggestions using LLM
-        prompt = f"""You are a helpful writing assistant. Given a piece of writing, please offer suggestions to improve it.
-
-Provide up to 5 suggestions. For each suggestion:
-- Include the original sentence/phrase
-- Provide the suggested improvement
-- Explain why this change improves the text
-
-Document content:
-{document.content}
-
-Format each suggestion as:
-ORIGINAL: [original text]
-SUGGESTED: [suggested text]
-REASON: [explanation]
+        # Ask for suggestions on each part of the document concurrently, so a long
+        # document takes about as long as its slowest part
+        chunks = _split_into_chunks(content, MAX_SUGGESTION_CHUNKS)
+        if not chunks:
+            return {"error": "Document not found or has no content"}
+        per_chunk = -(-MAX_SUGGESTIONS // len(chunks))
+        conversations = [
+            [{"role": "user", "content": _SUGGEST_REQUEST.format(count=per_chunk, content=chunk)}]
+            for chunk in chunks
+        ]
 
-Suggestions:"""
+        suggestions_created = 0
 
         try:
-            response = llm_service.generate_chat(
-                messages=[{"role": "user", "content": prompt}], temperature=0.7
-            )
-
-            # Parse suggestions (simple parsing - could be improved)
-            suggestions_created = 0
-            lines = response.split("\n")
-            current_suggestion = {}
-
-            for line in lines:
-                line = line.strip()
-                if line.startswith("ORIGINAL:"):
-                    current_suggestion["original"] = line.replace("ORIGINAL:", "").strip()
-                elif line.startswith("SUGGESTED:"):
-                    current_suggestion["suggested"] = line.replace("SUGGESTED:", "").strip()
-                elif line.startswith("REASON:"):
-                    current_suggestion["reason"] = line.replace("REASON:", "").strip()
-
-                    # If we have all parts, create suggestion
-                    if all(
-                        k in current_suggestion for k in ["original", "suggested", "reason"]
-                    ):
-                        DocumentService.create_suggestion(
-                            db=db,
-                            document_id=doc_uuid,
-                            user_id=user_id,
-                            original_text=current_suggestion["original"],
-                            suggested_text=current_suggestion["suggested"],
-                            description=current_suggestion["reason"],
-                        )
-                        suggestions_created += 1
-                        current_suggestion = {}
+            # Every part streams concurrently on the shared event loop; this thread
+            # inserts each batch as it arrives, so the INSERTs overlap with the
+            # remaining generation
+            batches = iterate(_generate_suggestions(llm_service, conversations))
+            try:
+                for batch in batches:
+                    room = MAX_SUGGESTIONS - suggestions_created
+                    suggestions_created += DocumentService.create_suggestions_bulk(
+                        db, doc_uuid, user_id, batch[:room], commit=False
+                    )
+                    if suggestions_created >= MAX_SUGGESTIONS:
+                        break
+            finally:
+                # Stops the parts still generating once enough suggestions arrived
+                batches.close()
+
+            # Save the suggestions together in one commit
+            db.commit()
 
             return {
                 "id": document_id,
-                "title": document.title,
-                "kind": document.kind,
+                "title": title,
+                "kind": kind,
                 "message": f"{suggestions_created} suggestions have been added to the document",
             }
         except Exception as e:
+            db.rollback()
             return {"error": f"Failed to generate suggestions: {str(e)}"}
 
     return request_suggestions
@@ -1,12 +1,103 @@
 """Weather tool for LangChain."""
-from typing import Optional
+import logging
+from typing import Any, Dict, Optional, Tuple
 
+import httpx
+import orjson
 import requests
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
+from src.services.http_client import async_client, session
+from src.utils.cache import TTLCache
 
-@tool
-def get_weather(
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
+
+# Cities do not move; unknown names are retried after a few minutes
+GEOCODE_TTL = 24 * 60 * 60
+GEOCODE_MISS_TTL = 5 * 60
+
+_GEOCODE_CACHE = TTLCache(maxsize=1024, ttl=GEOCODE_TTL)
+_MISSING = object()
+
+# Open-Meteo refreshes current conditions about every 15 minutes
+WEATHER_TTL = 10 * 60
+
+_WEATHER_CACHE = TTLCache(maxsize=2048, ttl=WEATHER_TTL)
+
+logger = logging.getLogger(__name__)
+
+
+def _weather_cache_key(latitude: float, longitude: float) -> Tuple[float, float]:
+    """
+    Key forecasts by coordinates rounded to about a kilometre.
+
+    The key is taken after geocoding, so different names for the same city
+    share an entry.
+    """
+    return round(latitude, 2), round(longitude, 2)
+
+
+def _cached_weather(key: Tuple[float, float], city: Optional[str]) -> Optional[dict]:
+    """
+    Get a cached forecast.
+
+    Args:
+        key: Rounded coordinates
+        city: City name to label the result with
+
+    Returns:
+        Copy of the cached weather data, or None on a miss
+    """
+    weather_data = _WEATHER_CACHE.get(key)
+    logger.debug("weather cache %s for %s", "MISS" if weather_data is None else "HIT", key)
+    if weather_data is None:
+        return None
+    weather_data = dict(weather_data)
+    if city:
+        weather_data["cityName"] = city
+    return weather_data
+
+
+def _forecast_params(latitude: float, longitude: float) -> Dict[str, Any]:
+    """Query parameters of a forecast request."""
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "current": "temperature_2m",
+        "hourly": "temperature_2m",
+        "daily": "sunrise,sunset",
+        "timezone": "auto",
+    }
+
+
+def _geocode_params(name: str) -> Dict[str, Any]:
+    """Query parameters of a geocoding request."""
+    return {"name": name, "count": 1, "language": "en", "format": "json"}
+
+
+def _cache_geocode_result(key: str, data: Dict[str, Any]) -> Optional[dict]:
+    """
+    Extract and cache the coordinates of a geocoding response.
+
+    Args:
+        key: Normalized city name
+        data: Decoded geocoding response
+
+    Returns:
+        Dictionary with latitude and longitude, or None
+    """
+    if not data.get("results") or len(data["results"]) == 0:
+        _GEOCODE_CACHE.set(key, None, ttl=GEOCODE_MISS_TTL)
+        return None
+
+    result = data["results"][0]
+    coords = {"latitude": result["latitude"], "longitude": result["longitude"]}
+    _GEOCODE_CACHE.set(key, coords)
+    return coords
+
+
+def _fetch_weather(
     latitude: Optional[float] = None,
     longitude: Optional[float] = None,
     city: Optional[str] = None,
@@ -36,58 +127,148 @@ def get_weather(
             "error": "Please provide either a city name or both latitude and longitude coordinates."
         }
 
+    key = _weather_cache_key(latitude, longitude)
+    weather_data = _cached_weather(key, city)
+    if weather_data is not None:
+        return weather_data
+
     # Get weather data from Open-Meteo API
     try:
-        response = requests.get(
-            f"https://api.open-meteo.com/v1/forecast",
-            params={
-                "latitude": latitude,
-                "longitude": longitude,
-                "current": "temperature_2m",
-                "hourly": "temperature_2m",
-                "daily": "sunrise,sunset",
-                "timezone": "auto",
-            },
-            timeout=10,
+        response = session.get(
+            FORECAST_URL, params=_forecast_params(latitude, longitude), timeout=10
         )
         response.raise_for_status()
-        weather_data = response.json()
+        weather_data = orjson.loads(response.content)
+        _WEATHER_CACHE.set(key, weather_data)
+        weather_data = dict(weather_data)
 
         if city:
             weather_data["cityName"] = city
 
         return weather_data
-    except requests.RequestException as e:
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         return {"error": f"Failed to fetch weather data: {str(e)}"}
 
 
+async def aget_weather(
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    city: Optional[str] = None,
+) -> dict:
+    """
+    Get the current weather at a location without blocking the event loop.
+
+    Async counterpart of the ``get_weather`` tool using the shared HTTP client,
+    so several lookups awaited together overlap their network round trips.
+
+    Args:
+        latitude: Latitude coordinate
+        longitude: Longitude coordinate
+        city: City name
+
+    Returns:
+        Weather data dictionary
+    """
+    if city:
+        coords = await ageocode_city(city)
+        if not coords:
+            return {"error": f'Could not find coordinates for "{city}". Please check the city name.'}
+        latitude = coords["latitude"]
+        longitude = coords["longitude"]
+    elif latitude is None or longitude is None:
+        return {
+            "error": "Please provide either a city name or both latitude and longitude coordinates."
+        }
+
+    key = _weather_cache_key(latitude, longitude)
+    weather_data = _cached_weather(key, city)
+    if weather_data is not None:
+        return weather_data
+
+    try:
+        response = await async_client.get(
+            FORECAST_URL, params=_forecast_params(latitude, longitude)
+        )
+        response.raise_for_status()
+        weather_data = orjson.loads(response.content)
+        _WEATHER_CACHE.set(key, weather_data)
+        weather_data = dict(weather_data)
+
+        if city:
+            weather_data["cityName"] = city
+
+        return weather_data
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        return {"error": f"Failed to fetch weather data: {str(e)}"}
+
+
+# Agents that call the tool asynchronously use the coroutine, so parallel
+# weather lookups overlap instead of each blocking a worker thread
+get_weather = StructuredTool.from_function(
+    func=_fetch_weather, coroutine=aget_weather, name="get_weather"
+)
+
+
 def geocode_city(city: str) -> Optional[dict]:
     """
     Geocode city name to coordinates.
 
+    Results are cached per normalized city name, including names that could
+    not be found; failed requests are not cached.
+
     Args:
         city: City name
 
     Returns:
         Dictionary with latitude and longitude, or None
     """
+    name = city.strip()
+    key = name.lower()
+    coords = _GEOCODE_CACHE.get(key, _MISSING)
+    if coords is not _MISSING:
+        return coords
+
     try:
-        response = requests.get(
-            "https://geocoding-api.open-meteo.com/v1/search",
-            params={"name": city, "count": 1, "language": "en", "format": "json"},
-            timeout=10,
-        )
+        response = session.get(GEOCODING_URL, params=_geocode_params(name), timeout=10)
 
         if not response.ok:
             return None
 
-        data = response.json()
+        return _cache_geocode_result(key, orjson.loads(response.content))
+    except (requests.RequestException, orjson.JSONDecodeError):
+        return None
+
+
+async def ageocode_city(city: str) -> Optional[dict]:
+    """
+    Geocode city name to coordinates without blocking the event loop.
+
+    Shares its cache with ``geocode_city``; a cached city skips the request.
+
+    Args:
+        city: City name
+
+    Returns:
+        Dictionary with latitude and longitude, or None
+    """
+    name = city.strip()
+    key = name.lower()
+    coords = _GEOCODE_CACHE.get(key, _MISSING)
+    if coords is not _MISSING:
+        return coords
 
-        if not data.get("results") or len(data["results"]) == 0:
+    try:
+        response = await async_client.get(GEOCODING_URL, params=_geocode_params(name))
+
+        if not response.is_success:
             return None
 
-        result = data["results"][0]
-        return {"latitude": result["latitude"], "longitude": result["longitude"]}
-    except requests.RequestException:
+        return _cache_geocode_result(key, orjson.loads(response.content))
+    except (httpx.HTTPError, orjson.JSONDecodeError):
         return None
 
+
+def clear_caches():
+    """Forget every cached geocoding result and forecast."""
+    _GEOCODE_CACHE.clear()
+    _WEATHER_CACHE.clear()
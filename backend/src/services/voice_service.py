@@ -8,6 +8,9 @@ Future implementation:
 - Voice streaming for real-time interactions
 - Voice activity detection
 - Multi-language support
+
+Remote STT/TTS backends must be called through the shared clients in
+``src.services.http_client``; never create an HTTP client per call.
 """
 from typing import Optional
 
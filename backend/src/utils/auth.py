@@ -1,33 +1,66 @@
 """Authentication utilities for verifying Next.js session tokens."""
+import hmac
+import time
 import jwt
 from functools import wraps
+from hashlib import blake2b
 from typing import Optional
 from uuid import UUID
 
-from flask import request, jsonify
+from flask import g, request
 
 from src.config.settings import settings
+from src.utils.cache import TTLCache
+from src.utils.responses import orjson_response
+from src.utils.validation import parse_uuid
+
+# Decoded tokens are reused for up to a minute, and never past their own expiry
+TOKEN_CACHE_TTL = 60
+
+_TOKEN_CACHE = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL)
+
+# Key of the request's resolved user on flask.g
+_USER_ATTR = "_auth_user"
+
+# Settings are frozen, so the expected API key is encoded once
+_API_KEY_BYTES = settings.BACKEND_API_KEY.encode()
 
 
 def extract_user_from_token(token: str) -> Optional[dict]:
     """
     Extract user information from JWT token.
 
+    Verified payloads are cached under a digest of the token, so a client
+    repeating its bearer token skips signature verification; invalid tokens
+    are not cached.
+
     Args:
         token: JWT token string
 
     Returns:
         User information dictionary or None
     """
+    key = blake2b(token.encode(), digest_size=16).digest()
+    payload = _TOKEN_CACHE.get(key)
+    if payload is not None:
+        return payload
+
     try:
         # Decode JWT token (Next.js uses HS256 by default)
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-        return payload
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
 
+    ttl = TOKEN_CACHE_TTL
+    if "exp" in payload:
+        # PyJWT checks the expiry in whole seconds
+        ttl = min(ttl, int(payload["exp"]) - time.time())
+    if ttl > 0:
+        _TOKEN_CACHE.set(key, payload, ttl=ttl)
+    return payload
+
 
 def get_user_from_request() -> Optional[dict]:
     """
@@ -38,11 +71,32 @@ def get_user_from_request() -> Optional[dict]:
     2. x-user-id header (for development)
     3. Cookie (next-auth session)
 
+    The result is kept on ``flask.g``, so ``require_auth`` and the view it wraps
+    resolve the user once per request.
+
+    Returns:
+        User information dictionary or None
+    """
+    if _USER_ATTR in g:
+        return g.get(_USER_ATTR)
+
+    user = _resolve_user(request.headers)
+    setattr(g, _USER_ATTR, user)
+    return user
+
+
+def _resolve_user(headers) -> Optional[dict]:
+    """
+    Resolve the user from request headers.
+
+    Args:
+        headers: Request headers
+
     Returns:
         User information dictionary or None
     """
     # Check Authorization header
-    auth_header = request.headers.get("Authorization")
+    auth_header = headers.get("Authorization")
     if auth_header and auth_header.startswith("Bearer "):
         token = auth_header.split(" ")[1]
         user = extract_user_from_token(token)
@@ -50,7 +104,7 @@ def get_user_from_request() -> Optional[dict]:
             return user
 
     # Check x-user-id header (for development/testing)
-    user_id_header = request.headers.get("x-user-id")
+    user_id_header = headers.get("x-user-id")
     if user_id_header:
         try:
             return {"id": user_id_header, "email": "dev@example.com"}
@@ -72,7 +126,10 @@ def verify_api_key() -> bool:
         True if API key is valid
     """
     api_key = request.headers.get("X-API-Key")
-    return api_key == settings.BACKEND_API_KEY
+    if not api_key:
+        return False
+    # Constant-time comparison so response timing does not leak the key
+    return hmac.compare_digest(api_key.encode(), _API_KEY_BYTES)
 
 
 def require_auth(f):
@@ -90,7 +147,7 @@ def require_auth(f):
     def decorated_function(*args, **kwargs):
         user = get_user_from_request()
         if not user:
-            return jsonify({"error": "Unauthorized", "code": "unauthorized"}), 401
+            return orjson_response({"error": "Unauthorized", "code": "unauthorized"}, 401)
         return f(*args, **kwargs)
 
     return decorated_function
@@ -109,7 +166,7 @@ def require_api_key(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if not verify_api_key():
-            return jsonify({"error": "Invalid API key", "code": "invalid_api_key"}), 403
+            return orjson_response({"error": "Invalid API key", "code": "invalid_api_key"}, 403)
         return f(*args, **kwargs)
 
     return decorated_function
@@ -124,9 +181,6 @@ def get_user_id_from_request() -> Optional[UUID]:
     """
     user = get_user_from_request()
     if user and "id" in user:
-        try:
-            return UUID(user["id"])
-        except (ValueError, TypeError):
-            pass
+        return parse_uuid(user["id"])
     return None
 
@@ -1,29 +1,52 @@
 """Error handling utilities."""
 from typing import Any, Dict, Optional
 
+import orjson
+
+from src.utils.responses import ORJSON_OPTIONS
+
+
+def _encode_error(message: str, code: str) -> bytes:
+    """Encode the body of an error without details."""
+    return orjson.dumps({"error": message, "code": code})
+
 
 class APIError(Exception):
     """Base API error class."""
 
+    # Defaults of each error class; instances created without arguments share them
+    status_code = 500
+    default_message = "Internal server error"
+    default_code = "internal_error"
+
+    # Body of errors that keep the class defaults, encoded once per class
+    _default_body = _encode_error(default_message, default_code)
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the default body of each subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._default_body = _encode_error(cls.default_message, cls.default_code)
+
     def __init__(
         self,
-        message: str,
-        code: str = "internal_error",
-        status_code: int = 500,
+        message: Optional[str] = None,
+        code: Optional[str] = None,
+        status_code: Optional[int] = None,
         details: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize API error.
 
         Args:
-            message: Error message
-            code: Error code
-            status_code: HTTP status code
+            message: Error message, defaulting to the class's message
+            code: Error code, defaulting to the class's code
+            status_code: HTTP status code, defaulting to the class's status
             details: Additional error details
         """
-        self.message = message
-        self.code = code
-        self.status_code = status_code
+        self.message = self.default_message if message is None else message
+        self.code = self.default_code if code is None else code
+        if status_code is not None:
+            self.status_code = status_code
         self.details = details or {}
         super().__init__(self.message)
 
@@ -34,55 +57,64 @@ class APIError(Exception):
             error_dict["details"] = self.details
         return error_dict
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the error as a JSON body.
+
+        Errors that keep their class's message and code reuse one body encoded
+        when the class is defined.
+
+        Returns:
+            Serialized error body
+        """
+        if (
+            not self.details
+            and self.message == self.default_message
+            and self.code == self.default_code
+        ):
+            return self._default_body
+        return orjson.dumps(self.to_dict(), option=ORJSON_OPTIONS)
+
 
 class BadRequestError(APIError):
     """Bad request error (400)."""
 
-    def __init__(self, message: str = "Bad request", code: str = "bad_request", **kwargs):
-        """Initialize bad request error."""
-        super().__init__(message, code, 400, **kwargs)
+    status_code = 400
+    default_message = "Bad request"
+    default_code = "bad_request"
 
 
 class UnauthorizedError(APIError):
     """Unauthorized error (401)."""
 
-    def __init__(self, message: str = "Unauthorized", code: str = "unauthorized", **kwargs):
-        """Initialize unauthorized error."""
-        super().__init__(message, code, 401, **kwargs)
+    status_code = 401
+    default_message = "Unauthorized"
+    default_code = "unauthorized"
 
 
 class ForbiddenError(APIError):
     """Forbidden error (403)."""
 
-    def __init__(self, message: str = "Forbidden", code: str = "forbidden", **kwargs):
-        """Initialize forbidden error."""
-        super().__init__(message, code, 403, **kwargs)
+    status_code = 403
+    default_message = "Forbidden"
+    default_code = "forbidden"
 
 
 class NotFoundError(APIError):
     """Not found error (404)."""
 
-    def __init__(self, message: str = "Not found", code: str = "not_found", **kwargs):
-        """Initialize not found error."""
-        super().__init__(message, code, 404, **kwargs)
+    status_code = 404
+    default_message = "Not found"
+    default_code = "not_found"
 
 
 class RateLimitError(APIError):
     """Rate limit error (429)."""
 
-    def __init__(
-        self, message: str = "Rate limit exceeded", code: str = "rate_limit", **kwargs
-    ):
-        """Initialize rate limit error."""
-        super().__init__(message, code, 429, **kwargs)
+    status_code = 429
+    default_message = "Rate limit exceeded"
+    default_code = "rate_limit"
 
 
 class InternalServerError(APIError):
     """Internal server error (500)."""
-
-    def __init__(
-        self, message: str = "Internal server error", code: str = "internal_error", **kwargs
-    ):
-        """Initialize internal server error."""
-        super().__init__(message, code, 500, **kwargs)
-
@@ -0,0 +1,185 @@
+"""Process-wide event loop for running async I/O from synchronous code."""
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, AsyncIterator, Coroutine, Iterator, Optional
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop does not support Windows
+    uvloop = None
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+# Items buffered ahead of a synchronous consumer, and seconds between retries
+# while that buffer is full
+ITERATE_QUEUE_SIZE = 64
+ITERATE_PUT_INTERVAL = 0.01
+
+# Queued after the last item of an iterated async generator
+_EXHAUSTED = object()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop, starting it on first use.
+
+    The loop runs forever on a daemon thread. Every stream and async client of
+    the process lives on it, so connections are shared instead of being tied to
+    one short-lived loop per request.
+
+    Returns:
+        Running event loop
+    """
+    global _loop, _loop_thread
+    if _loop is not None:
+        return _loop
+
+    with _lock:
+        if _loop is None:
+            loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=loop.run_forever, name="event-loop", daemon=True
+            )
+            _loop_thread.start()
+            _loop = loop
+    return _loop
+
+
+def is_running() -> bool:
+    """
+    Check whether the shared event loop has been started.
+
+    Returns:
+        True once the loop is running
+    """
+    return _loop is not None and _loop.is_running()
+
+
+def submit(coro: Coroutine[Any, Any, Any]) -> Future:
+    """
+    Schedule a coroutine on the shared event loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Future resolving to the coroutine's result; cancelling it cancels the task
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def run_async(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the shared event loop and wait for its result.
+
+    Only the calling thread waits; the loop keeps serving other work meanwhile.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait for the result
+
+    Returns:
+        Result of the coroutine
+    """
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_async() would block the event loop it waits on; await instead")
+
+    future = submit(coro)
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        # Stop the abandoned work instead of leaving it running on the loop
+        future.cancel()
+        raise
+
+
+class _Raised:
+    """Exception raised by an iterated async generator, queued for the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def _put(items: queue.Queue, item: Any, cancelled: threading.Event) -> bool:
+    """
+    Put an item on a bounded queue, waiting without blocking the loop while it is full.
+
+    Args:
+        items: Queue read by the consumer
+        item: Item to hand over
+        cancelled: Set once the consumer has gone away
+
+    Returns:
+        True if the item was queued, False if the consumer went away
+    """
+    while not cancelled.is_set():
+        try:
+            items.put_nowait(item)
+            return True
+        except queue.Full:
+            await asyncio.sleep(ITERATE_PUT_INTERVAL)
+    return False
+
+
+async def _drain(async_gen: AsyncIterator[Any], items: queue.Queue, cancelled: threading.Event):
+    """
+    Run an async generator to completion, handing its items over through a queue.
+
+    Args:
+        async_gen: Async generator to drain
+        items: Queue read by the consumer
+        cancelled: Set once the consumer has gone away
+    """
+    try:
+        async for item in async_gen:
+            if not await _put(items, item, cancelled):
+                break
+    except Exception as error:
+        await _put(items, _Raised(error), cancelled)
+    finally:
+        await async_gen.aclose()
+        await _put(items, _EXHAUSTED, cancelled)
+
+
+def iterate(async_gen: AsyncIterator[Any], maxsize: int = ITERATE_QUEUE_SIZE) -> Iterator[Any]:
+    """
+    Iterate an async generator from synchronous code.
+
+    The whole generator runs as one task on the shared event loop and hands its
+    items over through a bounded queue, so the calling thread only waits on the
+    queue. Closing the iterator early cancels the task, which closes the
+    generator.
+
+    Args:
+        async_gen: Async generator to drain
+        maxsize: Items buffered ahead of the consumer
+
+    Yields:
+        Items of the async generator
+
+    Raises:
+        Any exception raised by the async generator
+    """
+    if threading.current_thread() is _loop_thread:
+        raise RuntimeError("iterate() would block the event loop it waits on; use async for")
+
+    items = queue.Queue(maxsize=maxsize)
+    cancelled = threading.Event()
+    producer = submit(_drain(async_gen, items, cancelled))
+
+    try:
+        while True:
+            item = items.get()
+            if item is _EXHAUSTED:
+                return
+            if isinstance(item, _Raised):
+                raise item.error
+            yield item
+    finally:
+        cancelled.set()
+        producer.cancel()
@@ -0,0 +1,27 @@
+"""Identifier generation."""
+import os
+import time
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The leading 48 bits hold the Unix time in milliseconds and the next 12 bits
+    the sub-millisecond fraction, so IDs sort by creation time and new rows land
+    at the right-hand edge of the primary key index.
+
+    Returns:
+        Version 7 UUID
+    """
+    milliseconds, nanoseconds = divmod(time.time_ns(), 1_000_000)
+    sub_millisecond = nanoseconds * 4096 // 1_000_000
+    random_bits = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    return UUID(
+        int=(milliseconds & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | sub_millisecond << 64
+        | 0b10 << 62
+        | random_bits
+    )
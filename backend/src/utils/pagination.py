@@ -0,0 +1,52 @@
+"""Keyset pagination cursors."""
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+from src.utils.validation import parse_uuid
+
+# Position of a row in an (updated_at DESC, id DESC) listing
+Cursor = Tuple[datetime, UUID]
+
+
+def encode_cursor(row: Any) -> str:
+    """
+    Encode the position of a row as an opaque cursor.
+
+    Args:
+        row: Model exposing ``updated_at`` and ``id``, or a dictionary with those keys
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(row, dict):
+        updated_at, row_id = row["updated_at"], row["id"]
+    else:
+        updated_at, row_id = row.updated_at, row.id
+    raw = f"{updated_at.isoformat()}|{row_id}"
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(value: Any) -> Optional[Cursor]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        value: Candidate cursor string
+
+    Returns:
+        (updated_at, id) tuple or None if the cursor is malformed
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        updated_at, _, row_id = urlsafe_b64decode(value.encode()).decode().partition("|")
+        updated_at = datetime.fromisoformat(updated_at)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    row_uuid = parse_uuid(row_id)
+    if row_uuid is None:
+        return None
+    return updated_at, row_uuid
@@ -0,0 +1,95 @@
+"""Response helpers for JSON endpoints."""
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import orjson
+from flask import Response, stream_with_context
+
+# Rows fetched per round trip when streaming list responses
+YIELD_PER = 200
+
+# Model timestamps are naive UTC; serialize them with an explicit offset
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
+
+def orjson_response(obj: Any, status: int = 200) -> Response:
+    """
+    Build a JSON response serialized with orjson.
+
+    UUIDs and datetimes are encoded natively, so models can hand them over
+    without converting them first.
+
+    Args:
+        obj: JSON-serializable object
+        status: HTTP status code
+
+    Returns:
+        Flask response
+    """
+    return Response(
+        orjson.dumps(obj, option=ORJSON_OPTIONS), status=status, mimetype="application/json"
+    )
+
+
+def stream_json_list(
+    rows: Iterable[Any],
+    key: str,
+    cursor_of: Optional[Callable[[Any], str]] = None,
+    limit: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Serialize rows as a JSON object with a single list, one row at a time.
+
+    Args:
+        rows: Iterable of models exposing ``to_dict``, or of plain dictionaries
+        key: Name of the list in the JSON object
+        cursor_of: Builds the next-page cursor from the last row; when given, the
+            object also carries ``next_cursor``
+        limit: Page size; a shorter page has no next cursor
+
+    Yields:
+        JSON byte chunks
+    """
+    yield b'{"' + key.encode() + b'":['
+    separator = b""
+    last = None
+    count = 0
+    for row in rows:
+        data = row if isinstance(row, dict) else row.to_dict()
+        yield separator + orjson.dumps(data, option=ORJSON_OPTIONS)
+        separator = b","
+        last = row
+        count += 1
+    if cursor_of is None:
+        yield b"]}"
+        return
+    next_cursor = None
+    if last is not None and (limit is None or count >= limit):
+        next_cursor = cursor_of(last)
+    yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+
+
+def json_list_response(
+    rows: Iterable[Any],
+    key: str,
+    status: int = 200,
+    cursor_of: Optional[Callable[[Any], str]] = None,
+    limit: Optional[int] = None,
+) -> Response:
+    """
+    Build a streamed JSON response for a list of models.
+
+    Args:
+        rows: Iterable of models exposing ``to_dict``, or of plain dictionaries
+        key: Name of the list in the JSON object
+        status: HTTP status code
+        cursor_of: Builds the next-page cursor from the last row
+        limit: Page size; a shorter page has no next cursor
+
+    Returns:
+        Flask response streaming the serialized rows
+    """
+    return Response(
+        stream_with_context(stream_json_list(rows, key, cursor_of, limit)),
+        status=status,
+        mimetype="application/json",
+    )
@@ -0,0 +1,24 @@
+"""Request validation helpers."""
+import re
+from typing import Any, Optional
+from uuid import UUID
+
+# Hex UUID with optional hyphens; every match is accepted by UUID()
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}\Z"
+)
+
+
+def parse_uuid(value: Any) -> Optional[UUID]:
+    """
+    Parse a UUID string without raising on malformed input.
+
+    Args:
+        value: Candidate UUID string
+
+    Returns:
+        Parsed UUID or None if the value is not a valid UUID
+    """
+    if not isinstance(value, str) or not _UUID_RE.match(value):
+        return None
+    return UUID(value)
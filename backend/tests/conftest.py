@@ -2,6 +2,7 @@
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.config.database import Base
 
@@ -9,7 +10,12 @@ from src.config.database import Base
 @pytest.fixture(scope="session")
 def engine():
     """Create test database engine."""
-    return create_engine("sqlite:///:memory:")
+    # One shared connection keeps the in-memory database alive across threads
+    return create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
 
 
 @pytest.fixture(scope="session")
@@ -25,7 +31,8 @@ def db_session(engine, tables):
     """Create test database session."""
     connection = engine.connect()
     transaction = connection.begin()
-    Session = sessionmaker(bind=connection)
+    # Commits and rollbacks inside a test only reach a savepoint of the outer transaction
+    Session = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
     session = Session()
 
     yield session
@@ -0,0 +1,128 @@
+"""Tests for authentication utilities."""
+import time
+from uuid import uuid4
+
+import jwt
+import pytest
+from flask import Flask
+
+from src.config.settings import settings
+from src.utils import auth
+from src.utils.cache import TTLCache
+
+
+def make_token(user_id: str, expires_in: int = 300, secret: str = None) -> str:
+    """Sign a session token the way the frontend does."""
+    payload = {"id": user_id, "exp": int(time.time()) + expires_in}
+    return jwt.encode(payload, secret or settings.SECRET_KEY, algorithm="HS256")
+
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    """Give each test an empty token cache."""
+    cache = TTLCache(maxsize=auth._TOKEN_CACHE.maxsize, ttl=auth.TOKEN_CACHE_TTL)
+    monkeypatch.setattr(auth, "_TOKEN_CACHE", cache)
+    return cache
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Count signature verifications."""
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    return calls
+
+
+class TestTokenCache:
+    """Test the decoded token cache."""
+
+    def test_valid_token_is_decoded_once(self, token_cache, decodes):
+        """Test a repeated token skips signature verification."""
+        user_id = str(uuid4())
+        token = make_token(user_id)
+
+        assert auth.extract_user_from_token(token)["id"] == user_id
+        assert auth.extract_user_from_token(token)["id"] == user_id
+        assert len(decodes) == 1
+
+    def test_invalid_token_is_not_cached(self, token_cache, decodes):
+        """Test tokens with a bad signature are verified, and rejected, every time."""
+        token = make_token(str(uuid4()), secret="wrong-secret")
+
+        assert auth.extract_user_from_token(token) is None
+        assert auth.extract_user_from_token(token) is None
+        assert len(decodes) == 2
+
+    def test_cached_token_expires_with_the_token(self, token_cache, decodes):
+        """Test a cached payload is not served past the token's own expiry."""
+        expires_at = int(time.time()) + 1
+        token = jwt.encode(
+            {"id": str(uuid4()), "exp": expires_at}, settings.SECRET_KEY, algorithm="HS256"
+        )
+
+        assert auth.extract_user_from_token(token) is not None
+        time.sleep(max(0, expires_at - time.time()))
+        assert auth.extract_user_from_token(token) is None
+        assert len(decodes) == 2
+
+    def test_least_recently_used_token_is_evicted(self, monkeypatch, decodes):
+        """Test a full cache drops its least recently used token."""
+        monkeypatch.setattr(auth, "_TOKEN_CACHE", TTLCache(maxsize=2, ttl=auth.TOKEN_CACHE_TTL))
+        first, second, third = (make_token(str(uuid4())) for _ in range(3))
+
+        for token in (first, second, first, third):
+            auth.extract_user_from_token(token)
+        assert len(decodes) == 3
+
+        # The first token was used more recently than the second, so it survived
+        auth.extract_user_from_token(first)
+        assert len(decodes) == 3
+        auth.extract_user_from_token(second)
+        assert len(decodes) == 4
+
+
+class TestRequestUser:
+    """Test resolving the user of a request."""
+
+    def test_user_is_resolved_once_per_request(self, token_cache, decodes):
+        """Test require_auth and the view share one resolved user."""
+        app = Flask(__name__)
+        user_id = str(uuid4())
+        headers = {"Authorization": f"Bearer {make_token(user_id)}"}
+
+        with app.test_request_context(headers=headers):
+            assert str(auth.get_user_id_from_request()) == user_id
+            assert auth.get_user_from_request() is auth.get_user_from_request()
+        assert len(decodes) == 1
+
+    def test_require_auth_rejects_anonymous_requests(self):
+        """Test the decorator answers 401 without calling the view."""
+        app = Flask(__name__)
+        view = auth.require_auth(lambda: "ok")
+
+        with app.test_request_context():
+            response = view()
+        assert response.status_code == 401
+        assert response.get_json() == {"error": "Unauthorized", "code": "unauthorized"}
+
+        with app.test_request_context(headers={"x-user-id": str(uuid4())}):
+            assert view() == "ok"
+
+    def test_require_api_key(self):
+        """Test the decorator compares the key header before calling the view."""
+        app = Flask(__name__)
+        view = auth.require_api_key(lambda: "ok")
+
+        with app.test_request_context(headers={"X-API-Key": "wrong"}):
+            response = view()
+        assert response.status_code == 403
+        assert response.get_json() == {"error": "Invalid API key", "code": "invalid_api_key"}
+
+        with app.test_request_context(headers={"X-API-Key": settings.BACKEND_API_KEY}):
+            assert view() == "ok"
@@ -0,0 +1,60 @@
+"""Tests for in-process caches."""
+import pytest
+
+from src.utils import cache as cache_module
+from src.utils.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control the monotonic clock the cache reads."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    """Test entries are served until their TTL and missing afterwards."""
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+
+    clock[0] += 9.9
+    assert cache.get("a") == 1
+    clock[0] += 0.1
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    clock[0] += 20
+    assert cache.get("b", "gone") == "gone"
+
+
+def test_none_is_a_cacheable_value(clock):
+    """Test a cached None is told apart from a miss by the default."""
+    cache = TTLCache(maxsize=4, ttl=10)
+    missing = object()
+    cache.set("a", None)
+
+    assert cache.get("a", missing) is None
+    assert cache.get("b", missing) is missing
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    """Test a full cache evicts the entry read or written longest ago."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_clear(clock):
+    """Test clearing removes every entry."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.clear()
+
+    assert cache.get("a") is None
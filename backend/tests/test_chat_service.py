@@ -1,24 +1,13 @@
 """Tests for chat service."""
-import pytest
+from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from src.config.database import Base
+from sqlalchemy import inspect, update
+
 from src.models.chat import Chat
 from src.models.message import Message
 from src.services.chat_service import ChatService
-
-
-@pytest.fixture
-def db_session():
-    """Create test database session."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
+from src.utils.pagination import decode_cursor, encode_cursor
 
 
 class TestChatService:
@@ -100,6 +89,32 @@ class TestChatService:
         assert messages[0].role == "user"
         assert messages[1].role == "assistant"
 
+    def test_add_messages_bulk(self, db_session):
+        """Test adding several messages in one insert keeps their order."""
+        user_id = uuid4()
+        chat = ChatService.create_chat(db_session, user_id, "Test Chat", "private")
+
+        added = ChatService.add_messages_bulk(
+            db_session,
+            chat.id,
+            [
+                {"role": "user", "parts": [{"type": "text", "text": "Hello"}]},
+                {"role": "assistant", "parts": [{"type": "text", "text": "Hi!"}]},
+            ],
+        )
+        assert added == 2
+
+        messages = ChatService.get_messages(db_session, chat.id)
+        assert [message.role for message in messages] == ["user", "assistant"]
+        assert messages[0].id < messages[1].id
+
+        # Later single inserts, stamped by the database clock, sort after the batch
+        ChatService.add_message(
+            db_session, chat.id, "user", [{"type": "text", "text": "Again"}], []
+        )
+        messages = ChatService.get_messages(db_session, chat.id)
+        assert [message.role for message in messages] == ["user", "assistant", "user"]
+
     def test_get_user_chats(self, db_session):
         """Test getting user's chats."""
         user_id = uuid4()
@@ -111,6 +126,66 @@ class TestChatService:
         chats = ChatService.get_user_chats(db_session, user_id)
         assert len(chats) == 2
 
+    def test_get_user_chats_with_relationships(self, db_session):
+        """Test messages are loaded with the chats only when asked for."""
+        user_id = uuid4()
+        chat = ChatService.create_chat(db_session, user_id, "Chat", "private")
+        ChatService.add_message(db_session, chat.id, "user", [{"type": "text", "text": "Hi"}])
+        db_session.expire_all()
+
+        (plain,) = ChatService.get_user_chats(db_session, user_id)
+        assert "messages" in inspect(plain).unloaded
+
+        db_session.expire_all()
+        (loaded,) = ChatService.get_user_chats(db_session, user_id, with_relationships=True)
+        assert "messages" not in inspect(loaded).unloaded
+        assert [message.role for message in loaded.messages] == ["user"]
+
+    def test_list_chats_lite(self, db_session):
+        """Test listing user's chats as dictionaries."""
+        user_id = uuid4()
+
+        ChatService.create_chat(db_session, user_id, "Chat 1", "private")
+        ChatService.create_chat(db_session, user_id, "Chat 2", "private")
+
+        chats = ChatService.list_chats_lite(db_session, user_id)
+        assert len(chats) == 2
+        assert {chat["title"] for chat in chats} == {"Chat 1", "Chat 2"}
+        assert chats[0].keys() == Chat(title="", visibility="private").to_dict().keys()
+
+    def test_list_chats_pages_through_ties(self, db_session):
+        """Test cursor pages cover every chat once when timestamps are equal."""
+        user_id = uuid4()
+        chat_ids = [
+            ChatService.create_chat(db_session, user_id, f"Chat {index}", "private").id
+            for index in range(5)
+        ]
+        tied = datetime(2026, 1, 1, 12, 0, 0)
+        db_session.execute(
+            update(Chat).where(Chat.user_id == user_id).values(created_at=tied, updated_at=tied)
+        )
+
+        pages = []
+        cursor = None
+        while True:
+            page = ChatService.list_chats_lite(db_session, user_id, limit=2, cursor=cursor)
+            if not page:
+                break
+            pages.append([chat["id"] for chat in page])
+            # Round-trip the cursor the way the history endpoint does
+            cursor = decode_cursor(encode_cursor(page[-1]))
+            assert cursor == (tied, page[-1]["id"])
+
+        # Ties are broken by ID, and the boundary row is never repeated
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [chat_id for page in pages for chat_id in page] == sorted(chat_ids, reverse=True)
+
+    def test_decode_cursor_rejects_malformed_values(self):
+        """Test malformed cursors decode to None instead of raising."""
+        assert decode_cursor(None) is None
+        assert decode_cursor("not base64!") is None
+        assert decode_cursor(encode_cursor({"updated_at": datetime(2026, 1, 1), "id": "x"})) is None
+
     def test_update_chat_context(self, db_session):
         """Test updating chat context."""
         user_id = uuid4()
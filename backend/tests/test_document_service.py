@@ -0,0 +1,69 @@
+"""Tests for document service."""
+from uuid import uuid4
+
+from sqlalchemy import inspect
+
+from src.services.document_service import DocumentService
+
+
+class TestDocumentService:
+    """Test document service."""
+
+    def test_update_document_refreshes_loaded_documents(self, db_session):
+        """Test updates return the new content for documents already in the session."""
+        user_id = uuid4()
+        documents = [
+            DocumentService.create_document(db_session, user_id, f"Doc {index}", "orig")
+            for index in range(3)
+        ]
+
+        for index, document in enumerate(documents):
+            updated = DocumentService.update_document(
+                db_session, document.id, user_id, f"new{index}"
+            )
+            assert updated.content == f"new{index}"
+
+        for index, document in enumerate(documents):
+            fetched = DocumentService.get_document(db_session, document.id, user_id)
+            assert fetched.content == f"new{index}"
+
+    def test_update_document_wrong_user(self, db_session):
+        """Test updating another user's document changes nothing."""
+        user_id = uuid4()
+        document = DocumentService.create_document(db_session, user_id, "Doc", "orig")
+
+        assert DocumentService.update_document(db_session, document.id, uuid4(), "new") is None
+        fetched = DocumentService.get_document(db_session, document.id, user_id)
+        assert fetched.content == "orig"
+
+    def test_get_document_source(self, db_session):
+        """Test only documents with content are returned, as plain columns."""
+        user_id = uuid4()
+        document = DocumentService.create_document(db_session, user_id, "Doc", "Body", "code")
+        empty = DocumentService.create_document(db_session, user_id, "Empty", "")
+
+        assert tuple(DocumentService.get_document_source(db_session, document.id, user_id)) == (
+            "Doc",
+            "code",
+            "Body",
+        )
+        assert DocumentService.get_document_source(db_session, empty.id, user_id) is None
+        assert DocumentService.get_document_source(db_session, document.id, uuid4()) is None
+
+    def test_get_user_documents_with_relationships(self, db_session):
+        """Test suggestions are loaded with the documents only when asked for."""
+        user_id = uuid4()
+        document = DocumentService.create_document(db_session, user_id, "Doc", "Body")
+        suggestion = {"original_text": "a", "suggested_text": "b", "description": "c"}
+        DocumentService.create_suggestions_bulk(db_session, document.id, user_id, [suggestion])
+        db_session.expire_all()
+
+        (plain,) = DocumentService.get_user_documents(db_session, user_id)
+        assert "suggestions" in inspect(plain).unloaded
+
+        db_session.expire_all()
+        (loaded,) = DocumentService.get_user_documents(
+            db_session, user_id, with_relationships=True
+        )
+        assert "suggestions" not in inspect(loaded).unloaded
+        assert [item.original_text for item in loaded.suggestions] == ["a"]
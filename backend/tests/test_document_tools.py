@@ -0,0 +1,155 @@
+"""Tests for document tools."""
+import asyncio
+import threading
+from uuid import uuid4
+
+from src.services.document_service import DocumentService
+from src.services.tools import document_tools
+from src.services.tools.document_tools import request_suggestions_tool
+
+
+class FakeLLMService:
+    """LLM service streaming canned suggestions for each document part."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.calls = []
+
+    async def stream_chat(self, messages, system_prompt=None, temperature=0.7):
+        prompt = messages[0]["content"]
+        self.calls.append((prompt, system_prompt))
+        part = "one" if "Para one." in prompt else "two"
+        if part == self.fail_on:
+            raise RuntimeError("boom")
+
+        reply = "".join(
+            f"ORIGINAL: {part} {index}\nSUGGESTED: better {part} {index}\nREASON: clearer\n\n"
+            for index in range(3)
+        )
+        # Split tokens across line boundaries, as a real stream would
+        for start in range(0, len(reply), 7):
+            await self.before_token(part)
+            yield reply[start : start + 7]
+
+    async def before_token(self, part):
+        pass
+
+
+class TestParsing:
+    """Test splitting and parsing around suggestion generation."""
+
+    def test_iter_lines_reassembles_tokens(self):
+        """Test tokens are joined into lines, keeping an unterminated last line."""
+        lines = document_tools._iter_lines(["a", "b\nc", "d\n", "\n", "e"])
+        assert list(lines) == ["ab", "cd", "", "e"]
+
+    def test_parse_suggestions(self):
+        """Test complete blocks are parsed, incomplete ones dropped and repeats overridden."""
+        lines = [
+            "ORIGINAL: old",
+            "  SUGGESTED:  new  ",
+            "REASON: shorter",
+            "noise",
+            "ORIGINAL: only original",
+            "REASON: missing suggestion",
+            "SUGGESTED: orphan",
+            "ORIGINAL: replaced",
+            "ORIGINAL: a",
+            "SUGGESTED: b",
+            "REASON: first",
+            "REASON: second",
+        ]
+        assert list(document_tools._parse_suggestions(lines)) == [
+            {"original_text": "old", "suggested_text": "new", "description": "shorter"},
+            {"original_text": "a", "suggested_text": "b", "description": "first"},
+        ]
+
+    def test_split_into_chunks(self):
+        """Test paragraphs are grouped into at most the requested number of chunks."""
+        content = "\n\n".join(f"P{index}" for index in range(5))
+        assert document_tools._split_into_chunks(content, 2) == ["P0\n\nP1\n\nP2", "P3\n\nP4"]
+        assert document_tools._split_into_chunks(" \n\n ", 2) == []
+
+
+class TestRequestSuggestions:
+    """Test the request suggestions tool."""
+
+    def test_chunks_are_generated_and_saved(self, db_session):
+        """Test each part is prompted and the first suggestions to arrive are saved."""
+        user_id = uuid4()
+        document = DocumentService.create_document(
+            db_session, user_id, "Doc", "Para one.\n\nPara two."
+        )
+        llm = FakeLLMService()
+        tool = request_suggestions_tool(db_session, user_id, llm)
+
+        result = tool.invoke({"document_id": str(document.id)})
+
+        assert result["message"] == "5 suggestions have been added to the document"
+        assert result["title"] == "Doc"
+        assert len(llm.calls) == 2
+        assert all(system_prompt for _, system_prompt in llm.calls)
+        saved = [
+            suggestion.original_text
+            for suggestion in DocumentService.get_document_suggestions(db_session, document.id)
+        ]
+        assert len(saved) == 5
+        # Each part's suggestions are saved in the order the model produced them
+        for part in ("one", "two"):
+            texts = sorted(text for text in saved if text.startswith(part))
+            assert texts == [f"{part} {index}" for index in range(len(texts))]
+
+    def test_suggestions_are_inserted_while_generating(self, db_session, monkeypatch):
+        """Test suggestions are inserted before every part has finished generating."""
+        user_id = uuid4()
+        document = DocumentService.create_document(
+            db_session, user_id, "Doc", "Para one.\n\nPara two."
+        )
+        inserted = threading.Event()
+        create_suggestions_bulk = DocumentService.create_suggestions_bulk
+
+        def recording_create(*args, **kwargs):
+            inserted.set()
+            return create_suggestions_bulk(*args, **kwargs)
+
+        monkeypatch.setattr(DocumentService, "create_suggestions_bulk", recording_create)
+
+        class BlockingLLMService(FakeLLMService):
+            async def before_token(self, part):
+                if part == "two":
+                    # Part two only continues once part one's suggestions were inserted
+                    loop = asyncio.get_running_loop()
+                    assert await loop.run_in_executor(None, inserted.wait, 5)
+
+        tool = request_suggestions_tool(db_session, user_id, BlockingLLMService())
+        result = tool.invoke({"document_id": str(document.id)})
+
+        assert result["message"] == "5 suggestions have been added to the document"
+
+    def test_failed_generation_saves_nothing(self, db_session):
+        """Test a failing part reports an error and no suggestion is saved."""
+        user_id = uuid4()
+        document = DocumentService.create_document(
+            db_session, user_id, "Doc", "Para one.\n\nPara two."
+        )
+        tool = request_suggestions_tool(db_session, user_id, FakeLLMService(fail_on="two"))
+
+        result = tool.invoke({"document_id": str(document.id)})
+
+        assert result == {"error": "Failed to generate suggestions: boom"}
+        assert DocumentService.get_document_suggestions(db_session, document.id) == []
+
+    def test_empty_or_invalid_document(self, db_session):
+        """Test empty documents and malformed IDs are rejected before generation."""
+        user_id = uuid4()
+        document = DocumentService.create_document(db_session, user_id, "Empty", "")
+        llm = FakeLLMService()
+        tool = request_suggestions_tool(db_session, user_id, llm)
+
+        assert tool.invoke({"document_id": str(document.id)}) == {
+            "error": "Document not found or has no content"
+        }
+        assert tool.invoke({"document_id": "not-a-uuid"}) == {
+            "error": "Invalid document ID format"
+        }
+        assert llm.calls == []
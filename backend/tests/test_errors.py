@@ -0,0 +1,62 @@
+"""Tests for error handling utilities."""
+import orjson
+import pytest
+
+from src.utils.errors import (
+    APIError,
+    BadRequestError,
+    ForbiddenError,
+    InternalServerError,
+    NotFoundError,
+    RateLimitError,
+    UnauthorizedError,
+)
+
+# Status, message and code each error class answered with before defaults moved
+# to class attributes
+ERROR_DEFAULTS = [
+    (APIError, 500, "Internal server error", "internal_error"),
+    (BadRequestError, 400, "Bad request", "bad_request"),
+    (UnauthorizedError, 401, "Unauthorized", "unauthorized"),
+    (ForbiddenError, 403, "Forbidden", "forbidden"),
+    (NotFoundError, 404, "Not found", "not_found"),
+    (RateLimitError, 429, "Rate limit exceeded", "rate_limit"),
+    (InternalServerError, 500, "Internal server error", "internal_error"),
+]
+
+
+@pytest.mark.parametrize("error_class, status_code, message, code", ERROR_DEFAULTS)
+def test_default_error_body(error_class, status_code, message, code):
+    """Test default errors reuse a body equal to the serialized dictionary."""
+    error = error_class()
+
+    assert error.status_code == status_code
+    assert error.to_dict() == {"error": message, "code": code}
+    assert error.to_json_bytes() == orjson.dumps({"error": message, "code": code})
+    assert error.to_json_bytes() is error_class().to_json_bytes()
+    assert str(error) == message
+
+
+@pytest.mark.parametrize("error_class, status_code, message, code", ERROR_DEFAULTS)
+def test_custom_error_body(error_class, status_code, message, code):
+    """Test custom messages, codes and details are serialized per error."""
+    error = error_class("Chat not found", "missing_chat", details={"id": 1})
+
+    assert error.status_code == status_code
+    assert orjson.loads(error.to_json_bytes()) == {
+        "error": "Chat not found",
+        "code": "missing_chat",
+        "details": {"id": 1},
+    }
+    assert orjson.loads(error_class("Chat not found").to_json_bytes()) == {
+        "error": "Chat not found",
+        "code": code,
+    }
+
+
+def test_explicit_status_code():
+    """Test a status code passed to the base class overrides its default."""
+    error = APIError("Teapot", "teapot", 418)
+
+    assert error.status_code == 418
+    assert APIError.status_code == 500
@@ -1,6 +1,11 @@
 """Tests for LLM service."""
+import asyncio
+import threading
+import time
+
 import pytest
-from src.services.llm_service import LLMService, OllamaModelRegistry
+from src.services import llm_service
+from src.services.llm_service import LLMService, OllamaModelRegistry, _get_client, get_llm_service
 
 
 class TestOllamaModelRegistry:
@@ -39,7 +44,13 @@ class TestLLMService:
         """Test LLM service initialization."""
         service = LLMService("phi3:mini")
         assert service.model_id == "phi3:mini"
-        assert service._llm is None
+
+    def test_get_client_is_cached(self):
+        """Test Ollama clients are shared per host and model."""
+        client = _get_client("http://localhost:11434", "phi3:mini")
+        assert _get_client("http://localhost:11434", "phi3:mini") is client
+        assert _get_client("http://localhost:11434", "llama3.2:3b") is not client
+        assert client.model == "phi3:mini"
 
     def test_convert_messages_to_prompt(self):
         """Test message conversion to prompt."""
@@ -72,3 +83,123 @@ class TestLLMService:
         assert info is not None
         assert info["id"] == "phi3:mini"
 
+    def test_get_llm_service_is_cached(self):
+        """Test services are shared per model."""
+        service = get_llm_service("phi3:mini")
+        assert get_llm_service("phi3:mini") is service
+        assert get_llm_service("llama3.2:3b") is not service
+        assert service.model_id == "phi3:mini"
+
+    def test_generate_title_is_bounded_and_cached(self, monkeypatch):
+        """Test title generation stops early and reuses earlier titles."""
+        calls = []
+
+        class FakeClient:
+            def invoke(self, prompt, **kwargs):
+                calls.append(kwargs)
+                return ' "Trip Planning Help" '
+
+        monkeypatch.setattr(llm_service, "_get_client", lambda host, model_id: FakeClient())
+        service = LLMService("phi3:mini")
+        message = "Help me plan a trip to a place nobody has asked about"
+
+        assert service.generate_title(message) == "Trip Planning Help"
+        assert service.generate_title(message) == "Trip Planning Help"
+        assert len(calls) == 1
+        assert calls[0]["num_predict"] == llm_service.TITLE_MAX_TOKENS
+        assert calls[0]["stop"] == llm_service.TITLE_STOP
+
+    def test_stream_chat_uses_async_client(self, monkeypatch):
+        """Test tokens are streamed from the async Ollama client."""
+        requests = []
+
+        class FakeAsyncClient:
+            async def generate(self, **kwargs):
+                requests.append(kwargs)
+
+                async def parts():
+                    for token in ["Hel", "", "lo"]:
+                        yield {"response": token}
+
+                return parts()
+
+        monkeypatch.setattr(llm_service, "_get_async_client", lambda host: FakeAsyncClient())
+        service = LLMService("phi3:mini")
+        messages = [{"role": "user", "parts": [{"type": "text", "text": "Hi"}]}]
+
+        async def collect():
+            return [token async for token in service.stream_chat(messages, temperature=0.2)]
+
+        assert asyncio.run(collect()) == ["Hel", "lo"]
+        assert requests[0]["model"] == "phi3:mini"
+        assert requests[0]["stream"] is True
+        assert requests[0]["options"] == {"temperature": 0.2}
+
+    def test_generate_chat_runs_on_shared_loop(self, monkeypatch):
+        """Test non-streaming generation is awaited on the background event loop."""
+        threads = []
+
+        class FakeAsyncClient:
+            async def generate(self, **kwargs):
+                threads.append(threading.current_thread().name)
+                assert kwargs.get("stream", False) is False
+                return {"response": "Hello"}
+
+        monkeypatch.setattr(llm_service, "_get_async_client", lambda host: FakeAsyncClient())
+        service = LLMService("phi3:mini")
+        messages = [{"role": "user", "content": "Hi"}]
+
+        assert service.generate_chat(messages) == "Hello"
+        assert service.generate_chat(messages) == "Hello"
+        assert threads == ["event-loop", "event-loop"]
+
+    def test_stream_chat_sync_runs_on_shared_loop(self, monkeypatch):
+        """Test synchronous streaming drives the async client on the background loop."""
+        threads = []
+        closed = []
+
+        class FakeAsyncClient:
+            async def generate(self, **kwargs):
+                async def parts():
+                    try:
+                        for token in ["a", "b", "c"]:
+                            threads.append(threading.current_thread().name)
+                            yield {"response": token}
+                    finally:
+                        closed.append(True)
+
+                return parts()
+
+        monkeypatch.setattr(llm_service, "_get_async_client", lambda host: FakeAsyncClient())
+        service = LLMService("phi3:mini")
+        messages = [{"role": "user", "content": "Hi"}]
+
+        assert list(service.stream_chat_sync(messages)) == ["a", "b", "c"]
+        assert set(threads) == {"event-loop"}
+
+        tokens = service.stream_chat_sync(messages)
+        assert next(tokens) == "a"
+        tokens.close()
+        # The producer task is cancelled on the loop, which closes the stream shortly after
+        deadline = time.monotonic() + 1
+        while len(closed) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert closed == [True, True]
+
+    def test_stream_chat_sync_raises_stream_errors(self, monkeypatch):
+        """Test an error in the async stream is raised in the consuming thread."""
+
+        class FakeAsyncClient:
+            async def generate(self, **kwargs):
+                async def parts():
+                    yield {"response": "a"}
+                    raise ConnectionError("lost")
+
+                return parts()
+
+        monkeypatch.setattr(llm_service, "_get_async_client", lambda host: FakeAsyncClient())
+        tokens = LLMService("phi3:mini").stream_chat_sync([{"role": "user", "content": "Hi"}])
+
+        assert next(tokens) == "a"
+        with pytest.raises(ConnectionError, match="lost"):
+            next(tokens)
@@ -0,0 +1,103 @@
+"""Tests for SSE streaming service."""
+import asyncio
+
+import orjson
+
+from src.services.streaming_service import SSEService
+
+
+def collect(tokens, delays=None):
+    """Coalesce a token list, sleeping ``delays[index]`` before a token if given."""
+    delays = delays or {}
+
+    async def produce():
+        for index, token in enumerate(tokens):
+            if index in delays:
+                await asyncio.sleep(delays[index])
+            yield token
+
+    async def run():
+        return [chunk async for chunk in SSEService.coalesce_tokens(produce())]
+
+    return asyncio.run(run())
+
+
+class TestFrames:
+    """Test precomposed SSE frames."""
+
+    def test_text_delta_matches_format_sse(self):
+        """Test the fast path frames text exactly like the generic formatter."""
+        for content in ["Hello", 'quote " and \\ and\nnewline', "ünïcode ✓", ""]:
+            assert SSEService.text_delta(content) == SSEService.format_sse(
+                {"type": "text-delta", "content": content}
+            )
+
+    def test_message_frames_match_format_sse(self):
+        """Test message-start and message-finish templates match the generic formatter."""
+        message_id = "0f5b3a1e-8c2d-4b6a-9e7f-1a2b3c4d5e6f"
+        chat_id = "7a6b5c4d-3e2f-4a1b-8c9d-0e1f2a3b4c5d"
+
+        assert SSEService.message_start(message_id) == SSEService.format_sse(
+            {"type": "message-start", "id": message_id}
+        )
+        assert SSEService.message_start(message_id, chat_id) == SSEService.format_sse(
+            {"type": "message-start", "id": message_id, "chat_id": chat_id}
+        )
+        assert SSEService.message_finish(message_id) == SSEService.format_sse(
+            {"type": "message-finish", "id": message_id}
+        )
+
+
+class TestCoalesceTokens:
+    """Test token coalescing."""
+
+    def test_first_token_is_sent_alone(self):
+        """Test the first token is not held back by the batch."""
+        assert collect(["Hi", " there"])[0] == "Hi"
+
+    def test_flush_on_token_count(self):
+        """Test a batch is flushed once it holds FLUSH_TOKENS tokens."""
+        tokens = ["a"] + ["b"] * SSEService.FLUSH_TOKENS + ["c"] * 3
+        assert collect(tokens) == ["a", "b" * SSEService.FLUSH_TOKENS, "ccc"]
+
+    def test_flush_on_size(self):
+        """Test a batch is flushed once it holds FLUSH_SIZE characters."""
+        long_token = "x" * SSEService.FLUSH_SIZE
+        assert collect(["a", "y", long_token, "z"]) == ["a", "y" + long_token, "z"]
+
+    def test_flush_on_interval(self):
+        """Test buffered text is flushed when the next token is late."""
+        delay = SSEService.FLUSH_INTERVAL * 10
+        assert collect(["a", "b", "c", "d"], delays={3: delay}) == ["a", "bc", "d"]
+
+    def test_final_flush_keeps_all_text(self):
+        """Test text left in the batch is flushed when the stream ends."""
+        tokens = [f"t{index} " for index in range(20)]
+        chunks = collect(tokens)
+        assert "".join(chunks) == "".join(tokens)
+        assert len(chunks) < len(tokens)
+
+    def test_empty_stream(self):
+        """Test an empty stream yields nothing."""
+        assert collect([]) == []
+
+
+def test_stream_chat_response_frames():
+    """Test a reply is framed as start, coalesced deltas and finish."""
+
+    async def tokens():
+        for token in ["Hel", "lo"]:
+            yield token
+
+    async def run():
+        return [frame async for frame in SSEService.stream_chat_response(tokens(), "m1")]
+
+    frames = asyncio.run(run())
+    payloads = [orjson.loads(frame.split(b"data: ", 1)[1]) for frame in frames]
+    assert [payload["type"] for payload in payloads] == [
+        "message-start",
+        "text-delta",
+        "text-delta",
+        "message-finish",
+    ]
+    assert "".join(p["content"] for p in payloads if p["type"] == "text-delta") == "Hello"
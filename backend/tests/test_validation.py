@@ -0,0 +1,24 @@
+"""Tests for request validation helpers."""
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.utils.validation import parse_uuid
+
+
+def test_parse_uuid_accepts_canonical_and_compact_forms():
+    """Test hyphenated, upper-case and hyphen-less UUIDs are parsed."""
+    value = uuid4()
+
+    assert parse_uuid(str(value)) == value
+    assert parse_uuid(str(value).upper()) == value
+    assert parse_uuid(value.hex) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, 42, UUID(int=1), "", "not-a-uuid", "123", f"{uuid4()} ", f"{{{uuid4()}}}", "g" * 32],
+)
+def test_parse_uuid_rejects_malformed_values(value):
+    """Test malformed values return None instead of raising."""
+    assert parse_uuid(value) is None
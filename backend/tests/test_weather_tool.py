@@ -0,0 +1,60 @@
+"""Tests for the weather tool."""
+import pytest
+
+from src.services.tools import weather_tool
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests response."""
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.ok = True
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def requests_made(monkeypatch):
+    """Serve canned Open-Meteo responses and record the URLs requested."""
+    urls = []
+
+    def get(url, params=None, timeout=None):
+        urls.append(url)
+        if url == weather_tool.GEOCODING_URL:
+            if params["name"] == "Nowhere":
+                return FakeResponse(b'{"results": []}')
+            return FakeResponse(b'{"results": [{"latitude": 48.8566, "longitude": 2.3522}]}')
+        return FakeResponse(b'{"current": {"temperature_2m": 21.5}}')
+
+    weather_tool.clear_caches()
+    monkeypatch.setattr(weather_tool.session, "get", get)
+    yield urls
+    weather_tool.clear_caches()
+
+
+def test_weather_is_cached_per_location(requests_made):
+    """Test repeated lookups reuse the geocoding result and the forecast."""
+    first = weather_tool.get_weather.invoke({"city": "Paris"})
+    second = weather_tool.get_weather.invoke({"city": " paris "})
+
+    assert first == {"current": {"temperature_2m": 21.5}, "cityName": "Paris"}
+    assert second["cityName"] == " paris "
+    assert requests_made == [weather_tool.GEOCODING_URL, weather_tool.FORECAST_URL]
+
+
+def test_unknown_city_is_cached(requests_made):
+    """Test a city that cannot be found is not geocoded again right away."""
+    assert weather_tool.geocode_city("Nowhere") is None
+    assert weather_tool.geocode_city("Nowhere") is None
+    assert requests_made == [weather_tool.GEOCODING_URL]
+
+
+def test_clear_caches(requests_made):
+    """Test clearing the caches makes the next lookup hit the API again."""
+    weather_tool.get_weather.invoke({"latitude": 1.0, "longitude": 2.0})
+    weather_tool.clear_caches()
+    weather_tool.get_weather.invoke({"latitude": 1.0, "longitude": 2.0})
+
+    assert requests_made == [weather_tool.FORECAST_URL, weather_tool.FORECAST_URL]